@@ -41,8 +41,11 @@ console = Console()
 def main_callback(
     ctx: typer.Context,
     version: bool = typer.Option(False, "--version", "-v", help="显示版本信息"),
+    quiet: bool = typer.Option(False, "--quiet", "-q", help="不显示启动 Banner"),
 ) -> None:
     """cc-spec: 为AI编码助手设计的规格驱动开发工作流。"""
+    # --quiet 记录在 click 上下文中，由子命令读取，不修改进程环境变量
+    ctx.ensure_object(dict)["quiet"] = quiet
     if version:
         show_banner(console)
         console.print(f"[bold]cc-spec[/bold] 版本 {__version__}")
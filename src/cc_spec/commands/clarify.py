@@ -403,7 +403,8 @@ def clarify(
 
         # 读取 proposal.md 并检测歧义
         content = proposal_path.read_text(encoding="utf-8")
-        matches = detect(content)
+        # 报告面向人工审阅：同类型中被长关键词覆盖的短关键词不重复列出
+        matches = detect(content, dedup=True)
         show_ambiguity_report(matches, proposal_path)
 
         # v0.1.5：写入 workflow record（尽力而为）
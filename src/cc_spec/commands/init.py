@@ -8,7 +8,6 @@ from rich.console import Console
 from rich.panel import Panel
 from rich.tree import Tree
 
-from cc_spec.core.command_generator import CC_SPEC_COMMANDS, get_generator
 from cc_spec.core.config import Config, save_config
 from cc_spec.core.standards_renderer import (
     render_agents_md,
@@ -16,7 +15,12 @@ from cc_spec.core.standards_renderer import (
     write_managed_file,
 )
 from cc_spec.ui.banner import show_banner
-from cc_spec.utils.files import ensure_dir, get_cc_spec_dir, get_config_path
+from cc_spec.utils.files import (
+    copy_if_changed,
+    ensure_dir,
+    get_cc_spec_dir,
+    get_config_path,
+)
 
 console = Console()
 
@@ -60,6 +64,7 @@ __pycache__/
 
 
 def init_command(
+    ctx: typer.Context,
     project: Optional[str] = typer.Argument(
         None, help="项目名称（默认为当前目录名）"
     ),
@@ -89,8 +94,9 @@ def init_command(
         cc-spec init my-project
         cc-spec init --force  # 覆盖现有配置
     """
-    # 显示启动 Banner
-    show_banner(console)
+    # 显示启动 Banner（--quiet 时跳过）
+    if not (ctx.obj or {}).get("quiet"):
+        show_banner(console)
 
     # 获取项目根目录（当前目录）
     project_root = Path.cwd()
@@ -138,6 +144,9 @@ def init_command(
     # 步骤2: 为 Claude Code 生成命令文件
     console.print("[cyan]正在为 Claude Code 生成命令文件...[/cyan]")
 
+    # 延迟导入：命令生成器及全部命令模板只在 init/update 时需要，其余命令启动时不加载
+    from cc_spec.core.command_generator import CC_SPEC_COMMANDS, get_generator
+
     generator = get_generator("claude")
     if not generator:
         console.print("[red]错误：[/red] 未找到 Claude 的命令生成器。")
@@ -207,13 +216,11 @@ def init_command(
         bundled_templates_dir = Path(__file__).parent.parent / "templates"
 
         if bundled_templates_dir.exists():
-            import shutil
-
             # 复制所有模板文件（根目录）
             template_files = list(bundled_templates_dir.glob("*.md"))
             for template_file in template_files:
                 dest_file = templates_dir / template_file.name
-                shutil.copy2(template_file, dest_file)
+                copy_if_changed(template_file, dest_file)
 
             # 复制 checklists 子目录（如果存在）
             bundled_checklists_dir = bundled_templates_dir / "checklists"
@@ -224,7 +231,7 @@ def init_command(
                 checklist_files = list(bundled_checklists_dir.glob("*.md"))
                 for checklist_file in checklist_files:
                     dest_file = dest_checklists_dir / checklist_file.name
-                    shutil.copy2(checklist_file, dest_file)
+                    copy_if_changed(checklist_file, dest_file)
 
                 console.print(f"[green]✓[/green] 已复制 {len(template_files)} 个模板文件和 {len(checklist_files)} 个检查清单到 .cc-spec/templates/")
             else:
@@ -7,13 +7,16 @@
 
 """
 
+import json
 from datetime import datetime
+from operator import itemgetter
 from pathlib import Path
 from typing import Any, Optional
 
 import typer
 import yaml
-from rich.console import Console
+from rich.console import Console, Group, RenderableType
+from rich.text import Text
 
 from cc_spec.core.id_manager import IDManager
 from cc_spec.core.state import (
@@ -32,6 +35,26 @@ from cc_spec.version import TASKS_YAML_VERSION
 
 console = Console()
 
+# 基础 tasks.yaml 模板（字段顺序与 SubAgent 解析约定保持一致）
+_TASKS_YAML_TEMPLATE = (
+    "version: {version}\n"
+    "change: {change}\n"
+    "tasks:\n"
+    "  01-SETUP:\n"
+    "    wave: 0\n"
+    "    name: 初始化与准备\n"
+    "    tokens: 30k\n"
+    "    deps: []\n"
+    "    docs:\n"
+    "    - {proposal}\n"
+    "    code: []\n"
+    "    checklist:\n"
+    "    - 分析需求\n"
+    "    - 设计方案\n"
+    "    - 实现功能\n"
+    "    - 编写测试\n"
+)
+
 
 def plan_command(
     change_or_id: Optional[str] = typer.Argument(
@@ -111,36 +134,41 @@ def plan_command(
         )
         raise typer.Exit(1)
 
-    console.print(f"[cyan]正在规划变更：[/cyan] [bold]{change}[/bold]")
+    # 过程信息先缓存，最后一次性渲染，避免逐行 flush 终端
+    messages: list[RenderableType] = [
+        f"[cyan]正在规划变更：[/cyan] [bold]{change}[/bold]",
+    ]
 
     # 读取提案内容
     proposal_content = proposal_path.read_text(encoding="utf-8")
-    console.print(f"[dim]已读取 proposal（{len(proposal_content)} 个字符）[/dim]")
+    messages.append(f"[dim]已读取 proposal（{len(proposal_content)} 个字符）[/dim]")
 
     tasks_yaml_path = change_dir / "tasks.yaml"
 
-    console.print("\n[cyan]正在生成执行计划...[/cyan]")
+    messages.append("\n[cyan]正在生成执行计划...[/cyan]")
 
     # 生成 tasks.yaml
     try:
         _create_basic_tasks_yaml(tasks_yaml_path, change)
-        console.print("[green]√[/green] 已生成 tasks.yaml")
+        messages.append("[green]√[/green] 已生成 tasks.yaml")
     except Exception as e:
-        console.print(
-            f"[red]错误：[/red] 无法生成 tasks.yaml：{e}",
-            style="red",
+        messages.append(
+            Text.from_markup(f"[red]错误：[/red] 无法生成 tasks.yaml：{e}", style="red")
         )
+        console.print(Group(*messages))
         raise typer.Exit(1)
 
     # 校验依赖关系
-    console.print("\n[cyan]正在校验任务依赖...[/cyan]")
+    messages.append("\n[cyan]正在校验任务依赖...[/cyan]")
     validation_result = _validate_tasks_yaml_dependencies(tasks_yaml_path)
     if validation_result["valid"]:
-        console.print("[green]√[/green] 依赖关系校验通过")
+        messages.append("[green]√[/green] 依赖关系校验通过")
     else:
-        console.print(
-            f"[yellow]警告：[/yellow] {validation_result['message']}",
-            style="yellow",
+        messages.append(
+            Text.from_markup(
+                f"[yellow]警告：[/yellow] {validation_result['message']}",
+                style="yellow",
+            )
         )
 
     # 更新状态到 plan 阶段
@@ -157,37 +185,39 @@ def plan_command(
         )
 
         update_state(status_path, state)
-        console.print("\n[green]√[/green] 已将状态更新到 plan 阶段")
+        messages.append("\n[green]√[/green] 已将状态更新到 plan 阶段")
 
     except Exception as e:
-        console.print(
-            f"[yellow]警告：[/yellow] 无法更新状态：{e}",
-            style="yellow",
+        messages.append(
+            Text.from_markup(f"[yellow]警告：[/yellow] 无法更新状态：{e}", style="yellow")
         )
 
+    messages.append("\n[bold cyan]任务概览：[/bold cyan]")
+    console.print(Group(*messages))
+
     # 展示任务概览
-    console.print("\n[bold cyan]任务概览：[/bold cyan]")
     tasks_summary = _parse_tasks_yaml_summary(tasks_yaml_path)
     if tasks_summary:
         show_task_table(console, tasks_summary, show_wave=True, show_dependencies=True)
     else:
         console.print("[dim]（无任务可展示）[/dim]")
 
-    # 展示下一步
-    console.print(
-        "\n[bold green]计划生成成功！[/bold green]",
-        style="green",
-    )
-    console.print("\n[bold]下一步：[/bold]")
-    console.print("1. 查看并编辑 tasks.yaml，完善任务拆解")
-    console.print("2. 运行 [cyan]cc-spec apply[/cyan] 执行任务")
-
     # 显示生成的文件
     try:
         rel_path = tasks_yaml_path.relative_to(Path.cwd())
     except ValueError:
         rel_path = tasks_yaml_path
-    console.print(f"\n[dim]已生成文件：[/dim]\n  - {rel_path}")
+
+    # 展示下一步
+    console.print(
+        Group(
+            Text.from_markup("\n[bold green]计划生成成功！[/bold green]", style="green"),
+            "\n[bold]下一步：[/bold]",
+            "1. 查看并编辑 tasks.yaml，完善任务拆解",
+            "2. 运行 [cyan]cc-spec apply[/cyan] 执行任务",
+            f"\n[dim]已生成文件：[/dim]\n  - {rel_path}",
+        )
+    )
 
     # v0.1.5：写入 workflow record（尽力而为）
     try_write_record(
@@ -204,33 +234,17 @@ def plan_command(
 
 
 def _create_basic_tasks_yaml(tasks_yaml_path: Path, change_name: str) -> None:
-    """创建基础 tasks.yaml 结构。"""
-    data = {
-        "version": TASKS_YAML_VERSION,
-        "change": change_name,
-        "tasks": {
-            "01-SETUP": {
-                "wave": 0,
-                "name": "初始化与准备",
-                "tokens": "30k",
-                "deps": [],
-                "docs": [f".cc-spec/changes/{change_name}/proposal.md"],
-                "code": [],
-                "checklist": [
-                    "分析需求",
-                    "设计方案",
-                    "实现功能",
-                    "编写测试",
-                ],
-            }
-        },
-    }
+    """创建基础 tasks.yaml 结构。
 
-    yaml_content = yaml.dump(
-        data,
-        allow_unicode=True,
-        default_flow_style=False,
-        sort_keys=False,
+    结构固定，直接按模板输出，无需经过 yaml.dump；字符串值使用 JSON 双引号形式，
+    对 YAML 同样合法，避免变更名中的特殊字符破坏文档结构。
+    """
+    yaml_content = _TASKS_YAML_TEMPLATE.format(
+        version=json.dumps(TASKS_YAML_VERSION),
+        change=json.dumps(change_name, ensure_ascii=False),
+        proposal=json.dumps(
+            f".cc-spec/changes/{change_name}/proposal.md", ensure_ascii=False
+        ),
     )
     tasks_yaml_path.write_text(yaml_content, encoding="utf-8")
 
@@ -306,7 +320,7 @@ def _parse_tasks_yaml_summary(tasks_yaml_path: Path) -> list[dict[str, Any]]:
             )
 
         # 按 wave 排序
-        tasks.sort(key=lambda x: (x["wave"], x["id"]))
+        tasks.sort(key=itemgetter("wave", "id"))
         return tasks
 
     except Exception as e:
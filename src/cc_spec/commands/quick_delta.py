@@ -4,22 +4,23 @@
 
 """
 
+import os
 import re
 import subprocess
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 
 import typer
 from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
 
 from cc_spec.core.delta import DeltaOperation
 from cc_spec.rag.incremental import detect_git_changes
 from cc_spec.rag.workflow import try_write_mode_decision
-from cc_spec.ui.banner import show_banner
-from cc_spec.utils.files import ensure_dir, get_changes_dir
+from cc_spec.utils.files import atomic_write_text, ensure_dir, get_changes_dir
 
 console = Console()
 
@@ -27,6 +28,110 @@ console = Console()
 MAX_QUICK_DELTA_FILES = 5
 QUICK_DELTA_SKIPPED_STEPS = ["clarify", "plan", "apply", "checklist"]
 
+# git diff --name-status 状态码到变更类型的映射
+_STATUS_TO_OP = {
+    "A": DeltaOperation.ADDED,
+    "M": DeltaOperation.MODIFIED,
+    "D": DeltaOperation.REMOVED,
+    "R": DeltaOperation.RENAMED,
+}
+
+# 变更类型的终端显示样式与 mini-proposal 中的名称
+_OP_STYLES: dict[DeltaOperation, tuple[str, str]] = {
+    DeltaOperation.ADDED: ("[green]ADDED[/green]", "+"),
+    DeltaOperation.MODIFIED: ("[yellow]MODIFIED[/yellow]", "~"),
+    DeltaOperation.REMOVED: ("[red]REMOVED[/red]", "-"),
+    DeltaOperation.RENAMED: ("[blue]RENAMED[/blue]", "→"),
+}
+_OP_NAMES: dict[DeltaOperation, str] = {op: op.name for op in DeltaOperation}
+# 汇总统计的展示顺序及简写样式
+_OP_DISPLAY_ORDER = (
+    DeltaOperation.ADDED,
+    DeltaOperation.MODIFIED,
+    DeltaOperation.REMOVED,
+    DeltaOperation.RENAMED,
+)
+_OP_COUNT_MARKUP: dict[DeltaOperation, str] = {
+    DeltaOperation.ADDED: "[green]+{}[/green]",
+    DeltaOperation.MODIFIED: "[yellow]~{}[/yellow]",
+    DeltaOperation.REMOVED: "[red]-{}[/red]",
+    DeltaOperation.RENAMED: "[blue]→{}[/blue]",
+}
+
+# slug 生成：移除特殊字符 / 折叠空白与连字符
+_SLUG_STRIP_RE = re.compile(r"[^\w\s\u4e00-\u9fff-]")
+_SLUG_SEPARATOR_RE = re.compile(r"[\s-]+")
+# 纯 ASCII 消息的快速路径：大写转小写、空白与连字符统一为空格、其余符号删除，
+# 与上面两条正则的处理结果保持一致
+_ASCII_SLUG_TABLE = str.maketrans(
+    {
+        chr(i): (
+            chr(i).lower()
+            if chr(i).isalnum() or chr(i) == "_"
+            else " " if chr(i).isspace() or chr(i) == "-" else None
+        )
+        for i in range(128)
+    }
+)
+
+# mini-proposal.md 的固定段落
+_MINI_PROPOSAL_HEADER = """\
+# 快速变更：{message}
+
+## 变更信息
+
+- **变更名称**: {change_name}
+- **创建时间**: {created_at}
+- **变更类型**: quick-delta
+- **描述**: {message}
+
+"""
+
+_MINI_PROPOSAL_GIT_SECTION = """\
+## Git 信息
+
+- **提交**: `{hash}`
+- **作者**: {author}
+- **消息**: {message}
+
+"""
+
+_MINI_PROPOSAL_FOOTER = """\
+## 备注
+
+此变更通过 `cc-spec quick-delta` 命令快速创建，跳过了完整的规格流程。
+
+quick-delta 适用于：
+- 小改动（配置调整、样式修复等）
+- 紧急修复（hotfix）
+- 不需要设计规划的微小改进
+
+对于复杂变更，请使用完整的 cc-spec 工作流：
+1. `cc-spec specify` - 创建需求规格
+2. `cc-spec clarify` - 澄清需求
+3. `cc-spec plan` - 生成执行计划
+4. `cc-spec apply` - 执行任务
+5. `cc-spec checklist` - 验收打分
+6. `cc-spec archive` - 归档变更
+"""
+
+# quick-delta 调用 git 时追加的环境变量：关闭可选锁，避免与并发的 git commit 争用 index.lock；
+# 固定 C locale，使 --shortstat 等汇总行可解析。每次调用时再与 os.environ 合并，
+# 以便 PATH、GIT_DIR 等运行期修改生效
+_GIT_ENV_OVERRIDES = {"GIT_OPTIONAL_LOCKS": "0", "LC_ALL": "C"}
+# 统计变更规模时的 pathspec：覆盖整个仓库（与 _parse_git_diff 口径一致），
+# 排除仓库顶层与当前项目（相对 cwd）的 .cc-spec/
+_WORKTREE_PATHSPEC = ("--", ":(top)", ":(top,exclude).cc-spec", ":(exclude).cc-spec")
+# 单次 git 调用的超时时间（秒），防止异常配置（如慢速 include、挂起的 hook）卡住命令
+_GIT_TIMEOUT = 5.0
+
+# git diff --shortstat 输出："N files changed, X insertions(+), Y deletions(-)"
+_SHORTSTAT_RE = re.compile(
+    r"(\d+) files? changed"
+    r"(?:, (\d+) insertions?\(\+\))?"
+    r"(?:, (\d+) deletions?\(-\))?"
+)
+
 
 # ============================================================================
 # ============================================================================
@@ -68,7 +173,62 @@ class DiffStats:
         """统计指定操作类型的文件数。"""
         return sum(1 for c in self.changes if c.operation == operation)
 
+    def count_operations(self) -> Counter[DeltaOperation]:
+        """一次遍历统计各操作类型的文件数。"""
+        return Counter(c.operation for c in self.changes)
+
+
+@dataclass(frozen=True)
+class ChangeSummary:
+    """变更摘要，由 diff_stats 一次遍历得到，供表格、mini-proposal 与预览共用。
+
+    属性：
+        rows: 每个文件的 (变更类型, 文件显示文本, 行数统计文本)
+        counts: 各变更类型的文件数
+        additions: 总新增行数
+        deletions: 总删除行数
+    """
+
+    rows: tuple[tuple[DeltaOperation, str, str], ...]
+    counts: Counter[DeltaOperation]
+    additions: int
+    deletions: int
+
+    def counts_markup(self) -> str:
+        """按固定顺序生成各变更类型数量的 Rich 标记文本（如 ``+1 ~2``）。"""
+        return " ".join(
+            _OP_COUNT_MARKUP[op].format(self.counts[op])
+            for op in _OP_DISPLAY_ORDER
+            if self.counts[op] > 0
+        )
+
+
+def _run_git(
+    args: list[str], project_root: Path
+) -> subprocess.CompletedProcess[str] | None:
+    """在 project_root 下执行一条 git 命令（统一环境变量与超时）。
+
+    参数：
+        args: git 子命令及参数（不含 "git"）
+        project_root: git 命令的工作目录
+
+    返回：
+        CompletedProcess；git 不可用或超时返回 None
+    """
+    try:
+        return subprocess.run(
+            ["git", *args],
+            capture_output=True,
+            text=True,
+            cwd=project_root,
+            env={**os.environ, **_GIT_ENV_OVERRIDES},
+            timeout=_GIT_TIMEOUT,
+        )
+    except (FileNotFoundError, subprocess.TimeoutExpired):
+        return None
 
+
+@lru_cache(maxsize=8)
 def _count_changed_files(project_root: Path) -> int | None:
     """统计当前工作区的变更文件数（含 untracked）。"""
     change_set = detect_git_changes(project_root)
@@ -84,6 +244,80 @@ def _count_changed_files(project_root: Path) -> int | None:
     return len(filtered)
 
 
+@lru_cache(maxsize=8)
+def _diff_shortstat(project_root: Path) -> tuple[int, int, int] | None:
+    """探测整个仓库工作区相对 HEAD 的变更规模（不含 untracked 与 .cc-spec/）。
+
+    ``git diff --shortstat`` 只输出一行汇总，开销远小于逐文件统计，
+    用于在完整统计之前快速判断是否超出 quick-delta 阈值。
+
+    参数：
+        project_root: 项目根目录（git 命令的工作目录）
+
+    返回：
+        (文件数, 新增行数, 删除行数)；git 不可用或失败时返回 None
+    """
+    result = _run_git(
+        # --no-renames：重命名按删除+新增计 2 个文件，与 detect_git_changes 口径一致
+        ["diff", "HEAD", "--shortstat", "--no-renames", *_WORKTREE_PATHSPEC],
+        project_root,
+    )
+    if result is None or result.returncode != 0:
+        return None
+
+    match = _SHORTSTAT_RE.search(result.stdout)
+    if match is None:
+        return (0, 0, 0)
+    files, insertions, deletions = match.groups()
+    return (int(files), int(insertions or 0), int(deletions or 0))
+
+
+def _count_untracked_files(project_root: Path) -> int:
+    """统计整个仓库的 untracked 文件数（遵循 .gitignore，不含 .cc-spec/）。
+
+    与 ``_diff_shortstat`` 的已跟踪文件数相加即为工作区变更总数，
+    省去 ``detect_git_changes`` 中重复的 ``git diff HEAD`` 调用。
+
+    参数：
+        project_root: 项目根目录（git 命令的工作目录）
+
+    返回：
+        untracked 文件数；git 失败时返回 0
+    """
+    result = _run_git(
+        ["ls-files", "--others", "--exclude-standard", "-z", *_WORKTREE_PATHSPEC],
+        project_root,
+    )
+    if result is None or result.returncode != 0:
+        return 0
+    return result.stdout.count("\0")
+
+
+@lru_cache(maxsize=8)
+def _is_git_repo(project_root: Path) -> bool:
+    """判断 project_root 是否位于 git 工作区内。
+
+    参数：
+        project_root: 项目根目录
+
+    返回：
+        位于 git 工作区内返回 True；非仓库或 git 不可用时返回 False
+    """
+    result = _run_git(["rev-parse", "--is-inside-work-tree"], project_root)
+    if result is None:
+        return False
+    return result.returncode == 0 and result.stdout.strip() == "true"
+
+
+def _clear_git_caches() -> None:
+    """清空 git 查询缓存。"""
+    _is_git_repo.cache_clear()
+    _diff_shortstat.cache_clear()
+    _count_changed_files.cache_clear()
+    _git_diff_output.cache_clear()
+    _get_git_info.cache_clear()
+
+
 def _build_quick_requirements(message: str) -> dict[str, object]:
     """构建 quick-delta 的最小需求集结构（写入 KB 记录）。"""
     text = (message or "").strip()
@@ -96,45 +330,45 @@ def _build_quick_requirements(message: str) -> dict[str, object]:
     }
 
 
-def _parse_git_diff() -> DiffStats | None:
+@lru_cache(maxsize=8)
+def _git_diff_output(project_root: Path) -> str | None:
+    """获取用于解析文件变更的 git diff 原始输出。
+
+    优先取 staged 变更，如果没有则取最近一次 commit 的变更。
+    只缓存不可变的原始输出，解析结果由调用方每次重新构建。
+
+    参数：
+        project_root: 项目根目录（git 命令的工作目录）
+
+    返回：
+        git diff 的原始输出；命令失败或无变更时返回 None
+    """
+    return _run_diff("--staged", project_root) or _run_diff("HEAD~1", project_root)
+
+
+def _parse_git_diff(project_root: Path) -> DiffStats | None:
     """解析 git diff 获取文件变更列表 。
 
     优先解析 staged 变更，如果没有则解析最近一次 commit 的变更。
+    git 输出按 project_root 缓存，每次调用都返回新建的 DiffStats。
+
+    参数：
+        project_root: 项目根目录（git 命令的工作目录）
 
     返回：
         DiffStats 对象，包含变更列表和统计信息；如果失败则返回 None
     """
-    # 首先尝试获取 staged 变更
-    result = subprocess.run(
-        ["git", "diff", "--staged", "--name-status"],
-        capture_output=True,
-        text=True,
-    )
-
-    if result.returncode == 0 and result.stdout.strip():
-        changes = _parse_name_status(result.stdout)
-        stats = _get_diff_stats("--staged")
-    else:
-        # 没有 staged 变更，尝试获取最近一次 commit 的变更
-        result = subprocess.run(
-            ["git", "diff", "HEAD~1", "--name-status"],
-            capture_output=True,
-            text=True,
-        )
-
-        if result.returncode != 0 or not result.stdout.strip():
-            return None
+    output = _git_diff_output(project_root)
+    if not output:
+        return None
 
-        changes = _parse_name_status(result.stdout)
-        stats = _get_diff_stats("HEAD~1")
+    changes = _parse_diff_output(output)
 
-    # 合并行数统计到 changes
+    # 一次遍历同时累计新增与删除行数
+    total_additions = total_deletions = 0
     for change in changes:
-        if change.path in stats:
-            change.additions, change.deletions = stats[change.path]
-
-    total_additions = sum(c.additions for c in changes)
-    total_deletions = sum(c.deletions for c in changes)
+        total_additions += change.additions
+        total_deletions += change.deletions
 
     return DiffStats(
         changes=changes,
@@ -143,95 +377,100 @@ def _parse_git_diff() -> DiffStats | None:
     )
 
 
-def _parse_name_status(output: str) -> list[FileChange]:
-    """解析 git diff --name-status 输出。
+def _run_diff(diff_target: str, project_root: Path) -> str | None:
+    """执行 ``git diff --raw --numstat -z``，一次取回变更类型与行数统计。
 
     参数：
-        output: git diff --name-status 的输出
+        diff_target: diff 目标 (如 "--staged" 或 "HEAD~1")
+        project_root: git 命令的工作目录
 
     返回：
-        FileChange 列表
+        NUL 分隔的原始输出；命令失败或无变更时返回 None
     """
-    changes: list[FileChange] = []
-
-    for line in output.strip().split("\n"):
-        if not line:
-            continue
-
-        parts = line.split("\t")
-        if len(parts) < 2:
-            continue
-
-        status = parts[0][0]  # A/M/D/R 等
-        file_path = parts[1]
-
-        # 确定变更类型
-        if status == "A":
-            operation = DeltaOperation.ADDED
-        elif status == "M":
-            operation = DeltaOperation.MODIFIED
-        elif status == "D":
-            operation = DeltaOperation.REMOVED
-        elif status == "R":
-            operation = DeltaOperation.RENAMED
-        else:
-            # 其他状态 (C=复制, U=未合并等) 视为 MODIFIED
-            operation = DeltaOperation.MODIFIED
-
-        # 处理 RENAMED 的情况：格式为 R<score>\told_path\tnew_path
-        old_path = None
-        if status == "R" and len(parts) >= 3:
-            old_path = parts[1]
-            file_path = parts[2]
+    result = _run_git(["diff", diff_target, "--raw", "--numstat", "-z"], project_root)
 
-        changes.append(FileChange(
-            path=file_path,
-            operation=operation,
-            old_path=old_path,
-        ))
+    if result is None or result.returncode != 0 or not result.stdout:
+        return None
+    return result.stdout
 
-    return changes
 
+def _parse_diff_output(output: str) -> list[FileChange]:
+    """解析 ``git diff --raw --numstat -z`` 输出。
 
-def _get_diff_stats(diff_target: str) -> dict[str, tuple[int, int]]:
-    """获取每个文件的行数统计。
+    输出先是 raw 记录（``:<mode> <mode> <sha> <sha> <status>``，后跟 1~2 个路径），
+    再是 numstat 记录（``<add>\\t<del>\\t<path>``；重命名时路径为空，后跟新旧路径）。
+    -z 模式下路径不做转义，字段之间均以 NUL 分隔。
 
     参数：
-        diff_target: diff 目标 (如 "--staged" 或 "HEAD~1")
+        output: git diff 的原始输出
 
     返回：
-        文件路径到 (additions, deletions) 的映射
+        FileChange 列表（行数统计已合并）
     """
+    if not output:
+        return []
+
+    changes: list[FileChange] = []
     stats: dict[str, tuple[int, int]] = {}
 
-    result = subprocess.run(
-        ["git", "diff", diff_target, "--numstat"],
-        capture_output=True,
-        text=True,
-    )
+    fields = output.split("\0")
+    count = len(fields)
+    i = 0
+    while i < count:
+        field = fields[i]
+        i += 1
+        if not field:
+            continue
 
-    if result.returncode != 0:
-        return stats
+        if field[0] == ":":
+            # raw 记录：状态码在最后一列（R/C 带相似度分数）
+            status = field.rpartition(" ")[2][:1]
+            if not status or i >= count:
+                continue
 
-    for line in result.stdout.strip().split("\n"):
-        if not line:
+            if status in "RC" and i + 1 < count:
+                old_path, file_path = fields[i], fields[i + 1]
+                i += 2
+            else:
+                old_path, file_path = None, fields[i]
+                i += 1
+
+            # 其他状态 (C=复制, U=未合并等) 视为 MODIFIED
+            operation = _STATUS_TO_OP.get(status, DeltaOperation.MODIFIED)
+            changes.append(FileChange(
+                path=file_path,
+                operation=operation,
+                old_path=old_path if operation == DeltaOperation.RENAMED else None,
+            ))
             continue
 
-        parts = line.split("\t")
+        # numstat 记录：additions\tdeletions\tpath
+        parts = field.split("\t", 2)
         if len(parts) < 3:
             continue
+        if parts[2]:
+            file_path = parts[2]
+        elif i + 1 < count:
+            # 重命名/复制：路径为空，后跟旧路径与新路径
+            file_path = fields[i + 1]
+            i += 2
+        else:
+            continue
 
-        # numstat 格式: additions\tdeletions\tfilename
         try:
             # 二进制文件显示为 "-"
             additions = int(parts[0]) if parts[0] != "-" else 0
             deletions = int(parts[1]) if parts[1] != "-" else 0
-            file_path = parts[2]
-            stats[file_path] = (additions, deletions)
         except ValueError:
             continue
+        stats[file_path] = (additions, deletions)
 
-    return stats
+    # 合并行数统计到 changes
+    for change in changes:
+        if change.path in stats:
+            change.additions, change.deletions = stats[change.path]
+
+    return changes
 
 
 # ============================================================================
@@ -240,6 +479,7 @@ def _get_diff_stats(diff_target: str) -> dict[str, tuple[int, int]]:
 
 
 def quick_delta_command(
+    ctx: typer.Context,
     message: str = typer.Argument(..., help="变更描述（例如：修复登录页面样式问题）"),
 ) -> None:
     """超简单模式：一步生成变更记录。
@@ -258,8 +498,11 @@ def quick_delta_command(
     参数：
         message：变更描述，应该简洁明了地说明改动内容
     """
-    # 显示启动 Banner
-    show_banner(console)
+    # 显示启动 Banner（仅交互终端；管道/CI 或 --quiet 时跳过，且不加载 banner 模块）
+    if console.is_terminal and not (ctx.obj or {}).get("quiet"):
+        from cc_spec.ui.banner import show_banner
+
+        show_banner(console)
 
     # 查找项目根目录
     project_root = Path.cwd()
@@ -272,16 +515,34 @@ def quick_delta_command(
         )
         raise typer.Exit(1)
 
+    # git 查询结果只在单次命令内复用，避免沿用上一次调用的仓库状态
+    _clear_git_caches()
+
     # 1. 生成变更名称（格式：quick-YYYYMMDD-HHMMSS-{slug}）
+    # 同一时刻分别格式化：紧凑形式用于变更名称，可读形式写入 mini-proposal
     now = datetime.now()
     timestamp = now.strftime("%Y%m%d-%H%M%S")
+    created_at = now.strftime("%Y-%m-%d %H:%M:%S")
 
     # 从 message 生成 slug（取前30个字符，转换为 kebab-case）
     slug = _generate_slug(message)
     change_name = f"quick-{timestamp}-{slug}"
 
     # quick-delta 预检：文件数阈值 > 5 强制标准流程
-    file_count = _count_changed_files(project_root)
+    # 先用 shortstat 探测已跟踪文件的变更数，已超阈值时跳过 untracked 统计；
+    # shortstat 不可用（尚无提交等）时回退到完整检测
+    shortstat = _diff_shortstat(project_root)
+    # shortstat 成功即说明位于 git 仓库；失败时才探测一次，非仓库目录跳过后续全部 git 调用
+    in_git_repo = shortstat is not None or _is_git_repo(project_root)
+    file_count: int | None
+    if not in_git_repo:
+        file_count = None
+    elif shortstat is None:
+        file_count = _count_changed_files(project_root)
+    elif shortstat[0] > MAX_QUICK_DELTA_FILES:
+        file_count = shortstat[0]
+    else:
+        file_count = shortstat[0] + _count_untracked_files(project_root)
     if file_count is not None and file_count > MAX_QUICK_DELTA_FILES:
         try_write_mode_decision(
             project_root,
@@ -303,8 +564,22 @@ def quick_delta_command(
 
     console.print(f"[dim]变更名称：[/dim] [bold]{change_name}[/bold]")
 
-    # 2. 获取 Git 信息（如果可用）
-    git_info = _get_git_info()
+    # 2. 并发获取 Git 信息与 diff 统计（均为子进程等待），同时创建归档目录结构
+    git_info: dict[str, str] | None = None
+    diff_stats: DiffStats | None = None
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        if in_git_repo:
+            git_info_future = executor.submit(_get_git_info, project_root)
+            diff_future = executor.submit(_parse_git_diff, project_root)
+
+        # 直接在 archive 下创建变更目录
+        archive_dir = get_changes_dir(project_root) / "archive"
+        change_dir = archive_dir / change_name
+        ensure_dir(change_dir)
+
+        if in_git_repo:
+            git_info = git_info_future.result()
+            diff_stats = diff_future.result()
 
     if git_info:
         console.print(
@@ -313,12 +588,13 @@ def quick_delta_command(
     else:
         console.print("[dim]Git 信息：[/dim] 不可用")
 
-    diff_stats = _parse_git_diff()
+    # 变更摘要只生成一次，表格、mini-proposal 与预览共用
+    summary = _summarize_changes(diff_stats) if diff_stats else None
 
-    if diff_stats and diff_stats.changes:
-        console.print(f"[dim]文件变更：[/dim] {len(diff_stats.changes)} 个文件")
+    if summary and summary.rows:
+        console.print(f"[dim]文件变更：[/dim] {len(summary.rows)} 个文件")
         # 显示文件变更表格
-        _display_file_changes_table(diff_stats)
+        _display_file_changes_table(summary)
     else:
         console.print("[dim]文件变更：[/dim] 未检测到暂存区变更")
 
@@ -344,31 +620,22 @@ def quick_delta_command(
         extra_outputs=extra_outputs or None,
     )
 
-    # 3. 创建归档目录结构
-    changes_dir = get_changes_dir(project_root)
-    archive_dir = changes_dir / "archive"
-    ensure_dir(archive_dir)
-
-    # 直接在 archive 下创建变更目录
-    change_dir = archive_dir / change_name
-    ensure_dir(change_dir)
-
-    # 4. 创建 mini-proposal.md 
+    # 3. 创建 mini-proposal.md 
     mini_proposal_path = change_dir / "mini-proposal.md"
     mini_proposal_content = _generate_mini_proposal(
         message=message,
         change_name=change_name,
-        timestamp=now,
+        created_at=created_at,
         git_info=git_info,
-        diff_stats=diff_stats,  
+        summary=summary,
     )
 
-    mini_proposal_path.write_text(mini_proposal_content, encoding="utf-8")
+    atomic_write_text(mini_proposal_path, mini_proposal_content)
     console.print(
         "\n[green]✓[/green] 已创建 mini-proposal.md",
     )
 
-    # 5. 显示成功信息
+    # 4. 显示成功信息
     console.print(
         "\n[bold green]quick-delta 记录创建成功！[/bold green]",
         style="green",
@@ -380,9 +647,11 @@ def quick_delta_command(
         f"\n[dim]已归档到：[/dim] [cyan]{relative_path}[/cyan]"
     )
 
-    # 显示内容预览 
+    # 显示内容预览
+    from rich.panel import Panel
+
     preview_panel = Panel(
-        _format_preview(message, git_info, diff_stats),
+        _format_preview(message, git_info, summary),
         title="[bold]quick-delta 摘要[/bold]",
         border_style="green",
         padding=(1, 2),
@@ -405,20 +674,22 @@ def _generate_slug(message: str, max_length: int = 30) -> str:
     返回：
         kebab-case 格式的 slug
     """
-    # 转换为小写
-    slug = message.lower()
-
-    # 移除特殊字符，保留字母、数字、空格、中文字符
-    slug = re.sub(r"[^\w\s\u4e00-\u9fff-]", "", slug)
-
-    # 截取前 max_length 个字符
-    slug = slug[:max_length]
-
-    # 将空格替换为连字符
-    slug = re.sub(r"\s+", "-", slug.strip())
+    if message.isascii():
+        # 常见的纯 ASCII 消息用一次 translate 完成清洗，避免正则开销
+        cleaned = message.translate(_ASCII_SLUG_TABLE)
+        body = "-".join(cleaned.split())
+        # 保留首尾分隔符，使截断位置与正则路径一致
+        if cleaned[:1] == " ":
+            body = "-" + body
+        if cleaned[-1:] == " ":
+            body += "-"
+        slug = body[:max_length]
+    else:
+        # 转换为小写，移除特殊字符，保留字母、数字、空格、中文字符
+        slug = _SLUG_STRIP_RE.sub("", message.lower())
 
-    # 移除多余的连字符
-    slug = re.sub(r"-+", "-", slug)
+        # 空白与连字符统一折叠为单个连字符，再截取前 max_length 个字符
+        slug = _SLUG_SEPARATOR_RE.sub("-", slug)[:max_length]
 
     # 移除首尾连字符
     slug = slug.strip("-")
@@ -430,76 +701,52 @@ def _generate_slug(message: str, max_length: int = 30) -> str:
     return slug
 
 
-def _get_git_info() -> dict[str, str] | None:
+@lru_cache(maxsize=8)
+def _get_git_info(project_root: Path) -> dict[str, str] | None:
     """获取当前 Git commit 信息。
 
+    使用一次 ``git log -1`` 同时取出 hash、作者与标题，字段之间以 ASCII 单元分隔符
+    (\\x1f) 分隔；不在仓库中或尚无提交时 git 会以非零状态退出。
+    结果按 project_root 缓存，调用方不应修改返回的字典。
+
+    参数：
+        project_root: 项目根目录（git 命令的工作目录）
+
     返回：
         包含 hash、author、message 的字典，如果不在 Git 仓库则返回 None
     """
-    try:
-        # 检查是否在 Git 仓库中
-        subprocess.run(
-            ["git", "rev-parse", "--git-dir"],
-            check=True,
-            capture_output=True,
-            text=True,
-        )
-
-        # 获取最新 commit 的信息
-        git_hash = subprocess.run(
-            ["git", "rev-parse", "HEAD"],
-            check=True,
-            capture_output=True,
-            text=True,
-        ).stdout.strip()
-
-        git_author = subprocess.run(
-            ["git", "log", "-1", "--format=%an <%ae>"],
-            check=True,
-            capture_output=True,
-            text=True,
-        ).stdout.strip()
-
-        git_message = subprocess.run(
-            ["git", "log", "-1", "--format=%s"],
-            check=True,
-            capture_output=True,
-            text=True,
-        ).stdout.strip()
+    result = _run_git(["log", "-1", "--format=%H%x1f%an <%ae>%x1f%s"], project_root)
+    if result is None:
+        # Git 不可用或超时
+        return None
 
-        return {
-            "hash": git_hash,
-            "author": git_author,
-            "message": git_message,
-        }
+    if result.returncode != 0:
+        # 不在仓库中或尚无提交
+        return None
 
-    except (subprocess.CalledProcessError, FileNotFoundError):
-        # Git 不可用或不在仓库中
+    fields = result.stdout.rstrip("\n").split("\x1f", 2)
+    if len(fields) != 3:
         return None
 
+    git_hash, git_author, git_message = fields
+    return {
+        "hash": git_hash,
+        "author": git_author,
+        "message": git_message,
+    }
 
-def _display_file_changes_table(diff_stats: DiffStats) -> None:
-    """显示文件变更表格 。
+
+def _summarize_changes(diff_stats: DiffStats) -> ChangeSummary:
+    """一次遍历 diff_stats，生成表格、mini-proposal 与预览共用的变更摘要。
 
     参数：
         diff_stats：Git diff 统计信息
-    """
-    table = Table(title="文件变更", border_style="cyan", show_lines=False)
-    table.add_column("类型", style="cyan", justify="center", width=10)
-    table.add_column("文件", style="white")
-    table.add_column("+/-", style="dim", justify="right", width=10)
-
-    # 操作类型的显示样式
-    op_styles = {
-        DeltaOperation.ADDED: ("[green]ADDED[/green]", "+"),
-        DeltaOperation.MODIFIED: ("[yellow]MODIFIED[/yellow]", "~"),
-        DeltaOperation.REMOVED: ("[red]REMOVED[/red]", "-"),
-        DeltaOperation.RENAMED: ("[blue]RENAMED[/blue]", "→"),
-    }
 
+    返回：
+        ChangeSummary 对象
+    """
+    rows = []
     for change in diff_stats.changes:
-        op_text, _ = op_styles.get(change.operation, ("[dim]?[/dim]", "?"))
-
         # 文件路径 (RENAMED 显示 old -> new)
         if change.operation == DeltaOperation.RENAMED and change.old_path:
             file_display = f"{change.old_path} → {change.path}"
@@ -512,30 +759,40 @@ def _display_file_changes_table(diff_stats: DiffStats) -> None:
         else:
             stats_display = "-"
 
+        rows.append((change.operation, file_display, stats_display))
+
+    return ChangeSummary(
+        rows=tuple(rows),
+        counts=diff_stats.count_operations(),
+        additions=diff_stats.total_additions,
+        deletions=diff_stats.total_deletions,
+    )
+
+
+def _display_file_changes_table(summary: ChangeSummary) -> None:
+    """显示文件变更表格 。
+
+    参数：
+        summary：变更摘要
+    """
+    from rich.table import Table
+
+    table = Table(title="文件变更", border_style="cyan", show_lines=False)
+    table.add_column("类型", style="cyan", justify="center", width=10)
+    table.add_column("文件", style="white")
+    table.add_column("+/-", style="dim", justify="right", width=10)
+
+    for operation, file_display, stats_display in summary.rows:
+        op_text, _ = _OP_STYLES.get(operation, ("[dim]?[/dim]", "?"))
         table.add_row(op_text, file_display, stats_display)
 
     console.print()
     console.print(table)
 
     # 显示汇总统计
-    added_count = diff_stats.count_by_operation(DeltaOperation.ADDED)
-    modified_count = diff_stats.count_by_operation(DeltaOperation.MODIFIED)
-    removed_count = diff_stats.count_by_operation(DeltaOperation.REMOVED)
-    renamed_count = diff_stats.count_by_operation(DeltaOperation.RENAMED)
-
-    summary_parts = []
-    if added_count > 0:
-        summary_parts.append(f"[green]+{added_count}[/green]")
-    if modified_count > 0:
-        summary_parts.append(f"[yellow]~{modified_count}[/yellow]")
-    if removed_count > 0:
-        summary_parts.append(f"[red]-{removed_count}[/red]")
-    if renamed_count > 0:
-        summary_parts.append(f"[blue]→{renamed_count}[/blue]")
-
     stats_text = (
-        f"[dim]Total:[/dim] {' '.join(summary_parts)}, "
-        f"+{diff_stats.total_additions} -{diff_stats.total_deletions} lines"
+        f"[dim]Total:[/dim] {summary.counts_markup()}, "
+        f"+{summary.additions} -{summary.deletions} lines"
     )
     console.print(stats_text)
 
@@ -543,137 +800,70 @@ def _display_file_changes_table(diff_stats: DiffStats) -> None:
 def _generate_mini_proposal(
     message: str,
     change_name: str,
-    timestamp: datetime,
+    created_at: str,
     git_info: dict[str, str] | None,
-    diff_stats: DiffStats | None = None,  
+    summary: ChangeSummary | None = None,
 ) -> str:
     """生成 mini-proposal.md 内容。
 
     参数：
         message：变更描述
         change_name：变更名称
-        timestamp：创建时间
+        created_at：创建时间（YYYY-MM-DD HH:MM:SS）
         git_info：Git 信息（可选）
-        diff_stats：
+        summary：变更摘要（可选）
 
     返回：
         mini-proposal 的 markdown 内容
     """
-    lines = [
-        f"# 快速变更：{message}",
-        "",
-        "## 变更信息",
-        "",
-        f"- **变更名称**: {change_name}",
-        f"- **创建时间**: {timestamp.strftime('%Y-%m-%d %H:%M:%S')}",
-        "- **变更类型**: quick-delta",
-        f"- **描述**: {message}",
-        "",
+    sections = [
+        _MINI_PROPOSAL_HEADER.format(
+            message=message,
+            change_name=change_name,
+            created_at=created_at,
+        )
     ]
 
     # 添加 Git 信息（如果可用）
     if git_info:
-        lines.extend([
-            "## Git 信息",
-            "",
-            f"- **提交**: `{git_info['hash']}`",
-            f"- **作者**: {git_info['author']}",
-            f"- **消息**: {git_info['message']}",
-            "",
-        ])
-
-    if diff_stats and diff_stats.changes:
-        lines.extend([
-            "## 文件变更",
-            "",
-            "| 文件 | 类型 | +/- |",
-            "|------|------|-----|",
-        ])
-
-        op_names = {
-            DeltaOperation.ADDED: "ADDED",
-            DeltaOperation.MODIFIED: "MODIFIED",
-            DeltaOperation.REMOVED: "REMOVED",
-            DeltaOperation.RENAMED: "RENAMED",
-        }
-
-        for change in diff_stats.changes:
-            op_name = op_names.get(change.operation, "?")
-            if change.operation == DeltaOperation.RENAMED and change.old_path:
-                file_display = f"{change.old_path} → {change.path}"
-            else:
-                file_display = change.path
-
-            if change.additions > 0 or change.deletions > 0:
-                stats_display = f"+{change.additions} -{change.deletions}"
-            else:
-                stats_display = "-"
-
-            lines.append(f"| {file_display} | {op_name} | {stats_display} |")
+        sections.append(_MINI_PROPOSAL_GIT_SECTION.format(**git_info))
 
-        lines.append("")
+    if summary and summary.rows:
+        sections.append("## 文件变更\n\n| 文件 | 类型 | +/- |\n|------|------|-----|\n")
+        for operation, file_display, stats_display in summary.rows:
+            op_name = _OP_NAMES.get(operation, "?")
+            sections.append(f"| {file_display} | {op_name} | {stats_display} |\n")
 
         # 添加变更统计
-        lines.extend([
-            "## 变更统计",
-            "",
-        ])
-
-        added_count = diff_stats.count_by_operation(DeltaOperation.ADDED)
-        modified_count = diff_stats.count_by_operation(DeltaOperation.MODIFIED)
-        removed_count = diff_stats.count_by_operation(DeltaOperation.REMOVED)
-        renamed_count = diff_stats.count_by_operation(DeltaOperation.RENAMED)
-
-        if added_count > 0:
-            lines.append(f"- **ADDED**: {added_count} 文件")
-        if modified_count > 0:
-            lines.append(f"- **MODIFIED**: {modified_count} 文件")
-        if removed_count > 0:
-            lines.append(f"- **REMOVED**: {removed_count} 文件")
-        if renamed_count > 0:
-            lines.append(f"- **RENAMED**: {renamed_count} 文件")
+        sections.append("\n## 变更统计\n\n")
 
-        lines.append(
-            f"- **总计**: {len(diff_stats.changes)} 文件, "
-            f"+{diff_stats.total_additions} 行, -{diff_stats.total_deletions} 行"
+        for operation in _OP_DISPLAY_ORDER:
+            count = summary.counts[operation]
+            if count > 0:
+                sections.append(f"- **{_OP_NAMES[operation]}**: {count} 文件\n")
+
+        sections.append(
+            f"- **总计**: {len(summary.rows)} 文件, "
+            f"+{summary.additions} 行, -{summary.deletions} 行\n\n"
         )
-        lines.append("")
 
     # 添加备注
-    lines.extend([
-        "## 备注",
-        "",
-        "此变更通过 `cc-spec quick-delta` 命令快速创建，跳过了完整的规格流程。",
-        "",
-        "quick-delta 适用于：",
-        "- 小改动（配置调整、样式修复等）",
-        "- 紧急修复（hotfix）",
-        "- 不需要设计规划的微小改进",
-        "",
-        "对于复杂变更，请使用完整的 cc-spec 工作流：",
-        "1. `cc-spec specify` - 创建需求规格",
-        "2. `cc-spec clarify` - 澄清需求",
-        "3. `cc-spec plan` - 生成执行计划",
-        "4. `cc-spec apply` - 执行任务",
-        "5. `cc-spec checklist` - 验收打分",
-        "6. `cc-spec archive` - 归档变更",
-        "",
-    ])
+    sections.append(_MINI_PROPOSAL_FOOTER)
 
-    return "\n".join(lines)
+    return "".join(sections)
 
 
 def _format_preview(
     message: str,
     git_info: dict[str, str] | None,
-    diff_stats: DiffStats | None = None,  
+    summary: ChangeSummary | None = None,
 ) -> str:
     """格式化预览内容。
 
     参数：
         message：变更描述
         git_info：Git 信息（可选）
-        diff_stats：
+        summary：变更摘要（可选）
 
     返回：
         格式化的预览文本
@@ -687,25 +877,10 @@ def _format_preview(
             f"[bold]Git 提交：[/bold] {git_info['hash'][:7]} - {git_info['message']}"
         )
 
-    if diff_stats and diff_stats.changes:
-        added_count = diff_stats.count_by_operation(DeltaOperation.ADDED)
-        modified_count = diff_stats.count_by_operation(DeltaOperation.MODIFIED)
-        removed_count = diff_stats.count_by_operation(DeltaOperation.REMOVED)
-        renamed_count = diff_stats.count_by_operation(DeltaOperation.RENAMED)
-
-        parts = []
-        if added_count > 0:
-            parts.append(f"[green]+{added_count}[/green]")
-        if modified_count > 0:
-            parts.append(f"[yellow]~{modified_count}[/yellow]")
-        if removed_count > 0:
-            parts.append(f"[red]-{removed_count}[/red]")
-        if renamed_count > 0:
-            parts.append(f"[blue]→{renamed_count}[/blue]")
-
+    if summary and summary.rows:
         lines.append(
-            f"[bold]变更文件：[/bold] {' '.join(parts)} "
-            f"（+{diff_stats.total_additions} -{diff_stats.total_deletions} 行）"
+            f"[bold]变更文件：[/bold] {summary.counts_markup()} "
+            f"（+{summary.additions} -{summary.deletions} 行）"
         )
 
     return "\n".join(lines)
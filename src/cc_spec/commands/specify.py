@@ -15,15 +15,18 @@ from pathlib import Path
 
 import typer
 from rich.console import Console
-from rich.panel import Panel
 
 from cc_spec.core.id_manager import IDManager
 from cc_spec.core.state import ChangeState, Stage, StageInfo, TaskStatus, update_state
 from cc_spec.core.templates import copy_template
 from cc_spec.rag.models import WorkflowStep
 from cc_spec.rag.workflow import try_write_record
-from cc_spec.ui.banner import show_banner
-from cc_spec.utils.files import find_project_root, get_cc_spec_dir, get_changes_dir
+from cc_spec.utils.files import (
+    atomic_write_text,
+    find_project_root,
+    get_cc_spec_dir,
+    get_changes_dir,
+)
 
 console = Console()
 
@@ -68,6 +71,7 @@ def validate_change_name(name: str) -> tuple[bool, str]:
 
 
 def specify(
+    ctx: typer.Context,
     name_or_id: str = typer.Argument(
         ...,
         help="变更名称（例如 add-oauth）或 ID（例如 C-001）",
@@ -91,8 +95,11 @@ def specify(
         cc-spec specify add-oauth      # 创建新变更
         cc-spec specify C-001          # 编辑已有变更
     """
-    # 显示启动 Banner
-    show_banner(console)
+    # 显示启动 Banner（仅交互终端；管道/CI 或 --quiet 时跳过，且不加载 banner 模块）
+    if console.is_terminal and not (ctx.obj or {}).get("quiet"):
+        from cc_spec.ui.banner import show_banner
+
+        show_banner(console)
 
     # 查找项目根目录
     project_root = find_project_root()
@@ -131,6 +138,8 @@ def _edit_existing_change(
         project_root：项目根目录路径
         change_id：变更 ID（例如 C-001）
     """
+    from rich.panel import Panel
+
     entry = id_manager.get_change_entry(change_id)
     if not entry:
         console.print(f"[red]✗[/red] 未找到变更：{change_id}")
@@ -143,15 +152,17 @@ def _edit_existing_change(
         console.print(f"[red]✗[/red] 未找到提案文件：{proposal_path}")
         raise typer.Exit(1)
 
+    proposal_rel = proposal_path.relative_to(project_root)
+
     # 显示提示信息
     console.print()
     console.print(f"[cyan]正在编辑变更：[/cyan] [bold]{entry.name}[/bold] ({change_id})")
     console.print()
     console.print(Panel(
         f"[bold]文件：[/bold]\n"
-        f"  • {proposal_path.relative_to(project_root)}\n\n"
+        f"  • {proposal_rel}\n\n"
         f"[bold]下一步：[/bold]\n"
-        f"  1. 编辑 [cyan]{proposal_path.relative_to(project_root)}[/cyan]\n"
+        f"  1. 编辑 [cyan]{proposal_rel}[/cyan]\n"
         f"     包含 4 个章节：背景与目标、用户故事、技术决策、成功标准\n"
         f"  2. 运行 [bold]cc-spec clarify {change_id}[/bold] 进行审查\n"
         f"  3. 运行 [bold]cc-spec plan {change_id}[/bold] 生成任务",
@@ -165,7 +176,7 @@ def _edit_existing_change(
         step=WorkflowStep.SPECIFY,
         change_name=entry.name,
         inputs={"mode": "edit", "change_id": change_id},
-        outputs={"proposal": str(proposal_path.relative_to(project_root))},
+        outputs={"proposal": str(proposal_rel)},
         notes="specify.edit",
     )
 
@@ -186,6 +197,8 @@ def _create_new_change(
         name：变更名称
         template：模板类型
     """
+    from rich.panel import Panel
+
     # 校验变更名称
     is_valid, error_msg = validate_change_name(name)
     if not is_valid:
@@ -236,7 +249,7 @@ def _create_new_change(
         )
     except Exception:
         # 回退到默认模板内容
-        proposal_path.write_text(DEFAULT_PROPOSAL_TEMPLATE, encoding="utf-8")
+        atomic_write_text(proposal_path, DEFAULT_PROPOSAL_TEMPLATE)
 
     # 初始化 status.yaml
     state = ChangeState(
@@ -257,16 +270,19 @@ def _create_new_change(
     # 使用 ID 管理器注册变更
     change_id = id_manager.register_change(name, change_dir)
 
+    proposal_rel = proposal_path.relative_to(project_root)
+    status_rel = status_path.relative_to(project_root)
+
     # 显示成功提示
     console.print()
     console.print(f"[green]✓[/green] 已创建变更：[bold]{name}[/bold]（ID：{change_id}）")
     console.print()
     console.print(Panel(
         f"[bold]已创建文件：[/bold]\n"
-        f"  • {proposal_path.relative_to(project_root)}\n"
-        f"  • {status_path.relative_to(project_root)}\n\n"
+        f"  • {proposal_rel}\n"
+        f"  • {status_rel}\n\n"
         f"[bold]下一步：[/bold]\n"
-        f"  1. 编辑 [cyan]{proposal_path.relative_to(project_root)}[/cyan] 补充说明：\n"
+        f"  1. 编辑 [cyan]{proposal_rel}[/cyan] 补充说明：\n"
         f"     • 背景与目标：问题陈述、业务价值、技术约束\n"
         f"     • 用户故事：按优先级描述用户场景和验收标准\n"
         f"     • 技术决策：架构设计、模块划分、接口设计\n"
@@ -285,8 +301,8 @@ def _create_new_change(
         inputs={"mode": "create", "template": template},
         outputs={
             "change_id": change_id,
-            "proposal": str(proposal_path.relative_to(project_root)),
-            "status": str(status_path.relative_to(project_root)),
+            "proposal": str(proposal_rel),
+            "status": str(status_rel),
         },
         notes="specify.create",
     )
@@ -6,23 +6,31 @@ Codex CLI 作为执行层由 cc-spec 调用，不再生成 Codex prompts。
 
 from __future__ import annotations
 
-import asyncio
-import shutil
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import typer
 import yaml
 from rich.console import Console
 
-from cc_spec.core.command_generator import CC_SPEC_COMMANDS, get_generator
 from cc_spec.core.config import Config, load_config
 from cc_spec.ui.banner import show_banner
 from cc_spec.utils.download import download_file, get_github_raw_url
-from cc_spec.utils.files import find_project_root, get_cc_spec_dir
+from cc_spec.utils.files import (
+    atomic_write_text,
+    copy_if_changed,
+    find_project_root,
+    get_cc_spec_dir,
+)
 from cc_spec.version import CONFIG_VERSION, is_version_gte
 
 console = Console()
 
+# config.yaml 读写与 core.config 保持一致，同样使用 libyaml 加速版本
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
 TEMPLATE_REPO = "anthropics/cc-spec"  # TODO：更新为实际仓库
 TEMPLATE_BRANCH = "main"
 TEMPLATE_PATH_PREFIX = "templates"
@@ -77,15 +85,9 @@ def update_command(
         _update_templates(cc_spec_root, force)
         updated = True
 
-    target_lower = (target or "all").lower()
-
-    if target_lower in ("commands", "all"):
-        _update_slash_commands(project_root, config, force)
-        updated = True
-
-    if target_lower in ("subagent", "all"):
-        _update_subagent_config(cc_spec_root, force)
-        updated = True
+    # 查表分派：未知目标得到空元组；仅当处理函数确实产生变更时才标记 updated
+    for handler in _TARGET_HANDLERS.get((target or "all").lower(), ()):
+        updated |= handler(project_root, cc_spec_root, config, force)
 
     if updated:
         console.print("\n[green]√[/green] 更新完成。")
@@ -93,13 +95,23 @@ def update_command(
         console.print("[dim]Nothing to update.[/dim]")
 
 
-def _update_slash_commands(project_root: Path, config: Config, force: bool) -> None:
-    """更新 Claude Code slash 命令。"""
+def _update_slash_commands(
+    project_root: Path, cc_spec_root: Path, config: Config, force: bool
+) -> bool:
+    """更新 Claude Code slash 命令。
+
+    返回：
+        是否有命令文件被创建或更新
+    """
+    _ = cc_spec_root
     _ = config  # 预留：后续可能从 config 读取命令策略
     _ = force
 
     console.print("[cyan]正在更新 Claude Code slash 命令...[/cyan]")
 
+    # 延迟导入：只有更新命令文件时才加载命令生成器与全部命令模板
+    from cc_spec.core.command_generator import CC_SPEC_COMMANDS, get_generator
+
     generator = get_generator("claude")
     if not generator:
         console.print("[red]错误：[/red] 未找到 Claude 的命令生成器。")
@@ -108,11 +120,27 @@ def _update_slash_commands(project_root: Path, config: Config, force: bool) -> N
     updated_count = 0
     created_count = 0
     cmd_dir = generator.get_command_dir(project_root)
-
-    for cmd_name, description in CC_SPEC_COMMANDS:
-        before_exists = (cmd_dir / f"{cmd_name}.md").exists()
-        path = generator.update_command(cmd_name, description, project_root)
-        if not path:
+    update = generator.update_command_status
+    # 循环前一次性算好各命令文件路径
+    commands = [
+        (cmd_name, description, cmd_dir / f"{cmd_name}.md")
+        for cmd_name, description in CC_SPEC_COMMANDS
+    ]
+
+    def _update_one(command: tuple[str, str, Path]) -> tuple[bool, bool]:
+        cmd_name, description, cmd_path = command
+        before_exists = cmd_path.exists()
+        _, written = update(cmd_name, description, project_root)
+        return written, before_exists
+
+    # update_command 不修改生成器状态，可共享同一实例；executor.map 按命令顺序返回计数所需结果
+    cmd_dir.mkdir(parents=True, exist_ok=True)
+    with ThreadPoolExecutor(max_workers=min(8, len(commands))) as executor:
+        results = list(executor.map(_update_one, commands))
+
+    # 只统计实际写入的文件；已存在且内容未变的命令不计入 updated
+    for written, before_exists in results:
+        if not written:
             continue
         if before_exists:
             updated_count += 1
@@ -122,22 +150,35 @@ def _update_slash_commands(project_root: Path, config: Config, force: bool) -> N
     console.print(
         f"  [green]√[/green] Claude 命令已生成/更新：created={created_count} updated={updated_count}"
     )
+    return bool(created_count or updated_count)
+
 
+def _update_subagent_config(
+    project_root: Path, cc_spec_root: Path, config: Config, force: bool
+) -> bool:
+    """更新 subagent 配置。
 
-def _update_subagent_config(cc_spec_root: Path, force: bool) -> None:
-    """更新 subagent 配置。"""
+    返回：
+        config.yaml 是否被改写
+    """
+    _ = project_root
     _ = force
     console.print("[cyan]正在更新 subagent 配置...[/cyan]")
 
     config_path = cc_spec_root / "config.yaml"
 
-    try:
-        with open(config_path, encoding="utf-8") as f:
-            data = yaml.safe_load(f) or {}
-    except (OSError, yaml.YAMLError):
-        data = {}
+    # 优先复用 load_config 已解析的原始字典；仅当 config 并非来自文件时才读盘。
+    # 复用时浅拷贝出新字典再修改，config.raw_data 保持与已加载的 Config 一致
+    if config.raw_data is not None:
+        data = dict(config.raw_data)
+    else:
+        # 一次性读取字节交给 libyaml 解析（原生处理 UTF-8，跳过文本层解码）
+        try:
+            data = yaml.load(config_path.read_bytes(), Loader=_YAML_LOADER) or {}
+        except (OSError, yaml.YAMLError):
+            data = {}
 
-    subagent = data.get("subagent", {})
+    subagent = dict(data.get("subagent") or {})
     updated = False
 
     if "common" not in subagent:
@@ -178,18 +219,30 @@ def _update_subagent_config(cc_spec_root: Path, force: bool) -> None:
         if current_version is None or not is_version_gte(current_version, CONFIG_VERSION):
             data["version"] = CONFIG_VERSION
 
-        with open(config_path, "w", encoding="utf-8") as f:
-            yaml.safe_dump(
+        # 先整体序列化为字符串，再经临时文件 + os.replace 原子替换，避免中断时留下半截配置
+        atomic_write_text(
+            config_path,
+            yaml.dump(
                 data,
-                f,
+                Dumper=_YAML_DUMPER,
                 default_flow_style=False,
                 sort_keys=False,
                 allow_unicode=True,
-            )
+            ),
+        )
 
         console.print("  [green]√[/green] 已更新 subagent 配置")
     else:
         console.print("  [dim]Subagent configuration is already up to date[/dim]")
+    return updated
+
+
+# 更新目标 -> 处理函数（按顺序执行）；统一签名 (project_root, cc_spec_root, config, force) -> bool
+_TARGET_HANDLERS: dict[str, tuple[Callable[[Path, Path, Config, bool], bool], ...]] = {
+    "commands": (_update_slash_commands,),
+    "subagent": (_update_subagent_config,),
+    "all": (_update_slash_commands, _update_subagent_config),
+}
 
 
 def _update_templates(cc_spec_root: Path, force: bool) -> None:
@@ -204,6 +257,8 @@ def _update_templates(cc_spec_root: Path, force: bool) -> None:
     updated_count = 0
     skipped_count = 0
 
+    # 阶段 1：确定需要下载的模板
+    jobs: list[tuple[str, Path, str]] = []
     for template_file in TEMPLATE_FILES:
         dest_path = templates_dir / template_file
 
@@ -213,16 +268,21 @@ def _update_templates(cc_spec_root: Path, force: bool) -> None:
 
         url = get_github_raw_url(
             TEMPLATE_REPO,
-            TEMPLATE_BRANCH,
             f"{TEMPLATE_PATH_PREFIX}/{template_file}",
+            branch=TEMPLATE_BRANCH,
         )
+        jobs.append((template_file, dest_path, url))
 
-        downloaded = False
-        try:
-            downloaded = asyncio.run(download_file(url, dest_path))
-        except Exception:
-            downloaded = False
+    # 阶段 2：在同一个事件循环中并发下载，再按原顺序汇报结果
+    # asyncio 仅在确有下载任务时才导入，不计入 CLI 启动开销
+    if jobs:
+        import asyncio
 
+        results = asyncio.run(_download_all(jobs))
+    else:
+        results = []
+
+    for (template_file, dest_path, _), downloaded in zip(jobs, results):
         if downloaded:
             console.print(f"  [green]√[/green] {template_file}（已下载）")
             updated_count += 1
@@ -230,7 +290,7 @@ def _update_templates(cc_spec_root: Path, force: bool) -> None:
 
         bundled_path = bundled_templates_dir / template_file
         if bundled_path.exists():
-            shutil.copy2(bundled_path, dest_path)
+            copy_if_changed(bundled_path, dest_path)
             console.print(f"  [green]√[/green] {template_file}（来自内置模板）")
             updated_count += 1
         else:
@@ -240,3 +300,34 @@ def _update_templates(cc_spec_root: Path, force: bool) -> None:
         console.print(f"\n[green]√[/green] 已更新 {updated_count} 个模板")
     if skipped_count > 0:
         console.print(f"[dim]已跳过 {skipped_count} 个模板[/dim]")
+
+
+async def _download_all(jobs: list[tuple[str, Path, str]]) -> list[bool]:
+    """并发下载全部模板。
+
+    参数：
+        jobs：(模板文件名, 目标路径, 下载 URL) 列表
+
+    返回：
+        与 jobs 顺序一致的下载结果列表
+    """
+
+    import asyncio
+
+    import httpx
+
+    async def _download(client: httpx.AsyncClient, url: str, dest_path: Path) -> bool:
+        # 单个下载失败只影响自身，避免 TaskGroup 取消其余下载
+        try:
+            return await download_file(url, dest_path, client=client)
+        except Exception:
+            return False
+
+    # 模板均位于同一主机：共享一个客户端，复用 keep-alive 连接与 TLS 会话
+    async with httpx.AsyncClient(timeout=30.0, follow_redirects=True) as client:
+        async with asyncio.TaskGroup() as tg:
+            tasks = [
+                tg.create_task(_download(client, url, dest_path))
+                for _, dest_path, url in jobs
+            ]
+    return [task.result() for task in tasks]
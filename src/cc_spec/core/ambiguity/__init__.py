@@ -15,6 +15,7 @@ from .detector import (
     get_keywords_by_type,
     get_type_description,
     is_in_code_block,
+    matches_to_json,
 )
 
 __all__ = [
@@ -27,4 +28,5 @@ __all__ = [
     "filter_false_positives",
     "get_type_description",
     "get_keywords_by_type",
+    "matches_to_json",
 ]
@@ -1,11 +1,21 @@
-"""歧义检测器的数据类和枚举定义。
+"""歧义检测器：数据类、枚举定义与检测实现。
 
 该模块定义了歧义检测系统的核心数据结构：
 - AmbiguityType: 9 种歧义分类枚举
 - AmbiguityMatch: 歧义匹配结果数据类
 - AMBIGUITY_KEYWORDS: 每种歧义类型的关键词映射
+
+detect() 的扫描流程：
+1. 一次遍历标记代码块内的行，跳过代码块与空行
+2. 每行只转小写一次，先用全部关键词构成的前缀树正则预过滤，不含关键词的行直接跳过
+3. 标题行、否定词等整行级过滤每行判断一次
+4. 剩余行用 Aho-Corasick 自动机单次扫描找出全部命中关键词，
+   再逐个排除 URL / 行内代码中的命中，上下文在首个有效命中时才构建
 """
 
+import json
+import re
+from collections import deque
 from dataclasses import dataclass, field
 from enum import Enum
 
@@ -130,7 +140,146 @@ AMBIGUITY_KEYWORDS: dict[AmbiguityType, list[str]] = {
 }
 
 
-@dataclass
+# 扁平化的 (类型, 关键词, 小写关键词)，保持 AMBIGUITY_KEYWORDS 的遍历顺序
+_KEYWORD_ENTRIES: tuple[tuple[AmbiguityType, str, str], ...] = tuple(
+    (ambiguity_type, keyword, keyword.lower())
+    for ambiguity_type, keywords in AMBIGUITY_KEYWORDS.items()
+    for keyword in keywords
+)
+_ALL_KEYWORDS: tuple[str, ...] = tuple(keyword for _, keyword, _ in _KEYWORD_ENTRIES)
+
+
+def _build_length_rank() -> tuple[int, ...]:
+    """计算每个条目按小写关键词长度降序的排名（长度相同保持原顺序）。"""
+    by_length = sorted(
+        range(len(_KEYWORD_ENTRIES)), key=lambda idx: -len(_KEYWORD_ENTRIES[idx][2])
+    )
+    rank = [0] * len(by_length)
+    for position, entry_idx in enumerate(by_length):
+        rank[entry_idx] = position
+    return tuple(rank)
+
+
+# 预先算好的长度排名，重叠去重时按它排序即可，无需每次计算关键词长度
+_KEYWORD_LENGTH_RANK = _build_length_rank()
+
+
+def _build_prefix_pattern(keywords: set[str]) -> str:
+    """把关键词集合按公共前缀合并成正则（字典树形式）。
+
+    首字符分支一次比较即可淘汰，扫描时无需逐个尝试上百个备选项。
+
+    参数：
+        keywords：小写关键词集合
+
+    返回：
+        与 "|".join(keywords) 匹配同一组字符串的正则源码
+    """
+    trie: dict[str, dict] = {}
+    for keyword in keywords:
+        node = trie
+        for char in keyword:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def _render(node: dict[str, dict]) -> str:
+        branches = [
+            re.escape(char) + _render(child)
+            for char, child in sorted(node.items())
+            if char
+        ]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        return f"(?:{body})?" if "" in node else body
+
+    return _render(trie)
+
+
+# 全部小写关键词的前缀树正则，一次扫描即可跳过不含任何关键词的行
+_KEYWORD_UNION_RE = re.compile(
+    _build_prefix_pattern({keyword_lower for _, _, keyword_lower in _KEYWORD_ENTRIES})
+)
+
+
+# 否定词：出现时表示内容已经明确，整行不标记为歧义（合并为一个正则，单次扫描）
+_NEGATION_WORDS: tuple[str, ...] = (
+    "已定义", "已确定", "已明确", "已指定", "已说明",
+    "已实现", "已完成", "已决定", "确定的", "明确的",
+    "defined", "determined", "specified", "confirmed", "clear",
+    "explicit", "concrete", "precise", "exact", "definite",
+)
+_NEGATION_RE = re.compile("|".join(map(re.escape, _NEGATION_WORDS)))
+
+# URL 与行内代码（`code`）的匹配模式
+_URL_RE = re.compile(r"https?://[^\s)]+")
+_INLINE_CODE_RE = re.compile(r"`[^`]+`")
+
+
+def _build_keyword_automaton() -> tuple[
+    tuple[dict[str, int], ...], tuple[int, ...], tuple[tuple[int, ...], ...]
+]:
+    """基于全部小写关键词构建 Aho-Corasick 自动机。
+
+    返回：
+        (goto, fail, output)：goto 为各状态的字符转移表，fail 为失败指针，
+        output 为到达各状态时命中的 _KEYWORD_ENTRIES 下标
+    """
+    goto: list[dict[str, int]] = [{}]
+    output: list[list[int]] = [[]]
+    for entry_idx, (_, _, keyword_lower) in enumerate(_KEYWORD_ENTRIES):
+        state = 0
+        for char in keyword_lower:
+            next_state = goto[state].get(char)
+            if next_state is None:
+                goto.append({})
+                output.append([])
+                next_state = len(goto) - 1
+                goto[state][char] = next_state
+            state = next_state
+        output[state].append(entry_idx)
+
+    # 按 BFS 顺序计算失败指针，并把后缀状态的输出合并进来
+    fail = [0] * len(goto)
+    queue = deque(goto[0].values())
+    while queue:
+        state = queue.popleft()
+        for char, next_state in goto[state].items():
+            queue.append(next_state)
+            fallback = fail[state]
+            while fallback and char not in goto[fallback]:
+                fallback = fail[fallback]
+            fail[next_state] = goto[fallback].get(char, 0)
+            output[next_state].extend(output[fail[next_state]])
+
+    return tuple(goto), tuple(fail), tuple(tuple(out) for out in output)
+
+
+_AC_GOTO, _AC_FAIL, _AC_OUTPUT = _build_keyword_automaton()
+
+
+def _find_keyword_entries(line_lower: str) -> list[int]:
+    """单次扫描找出行内出现的全部关键词。
+
+    参数：
+        line_lower: 已转换为小写的行内容
+
+    返回：
+        命中的 _KEYWORD_ENTRIES 下标（升序，即 AMBIGUITY_KEYWORDS 的遍历顺序）
+    """
+    goto, fail, output = _AC_GOTO, _AC_FAIL, _AC_OUTPUT
+    state = 0
+    found: set[int] = set()
+    for char in line_lower:
+        while state and char not in goto[state]:
+            state = fail[state]
+        state = goto[state].get(char, 0)
+        if output[state]:
+            found.update(output[state])
+    return sorted(found)
+
+
+@dataclass(frozen=True, slots=True)
 class AmbiguityMatch:
     """歧义匹配结果。
 
@@ -170,6 +319,35 @@ class AmbiguityMatch:
         }
 
 
+def matches_to_json(matches: list[AmbiguityMatch]) -> str:
+    """将一组歧义匹配批量序列化为 JSON 数组字符串。
+
+    逐条构建字典后只调用一次 json.dumps（C 编码器），
+    避免大量匹配时逐条序列化再拼接。
+
+    参数：
+        matches: 歧义匹配列表
+
+    返回：
+        JSON 数组字符串（保留中文字符）
+    """
+    return json.dumps([m.to_dict() for m in matches], ensure_ascii=False)
+
+
+# 歧义类型的中文描述
+_TYPE_DESCRIPTIONS: dict[AmbiguityType, str] = {
+    AmbiguityType.SCOPE: "范围歧义 - 功能边界、模块范围、影响范围不明确",
+    AmbiguityType.DATA_STRUCTURE: "数据结构歧义 - 字段定义、类型、关联关系不明确",
+    AmbiguityType.INTERFACE: "接口歧义 - API 设计、参数、返回值不明确",
+    AmbiguityType.VALIDATION: "验证歧义 - 输入校验规则、约束条件不明确",
+    AmbiguityType.ERROR_HANDLING: "错误处理歧义 - 异常处理、降级策略、重试逻辑不明确",
+    AmbiguityType.PERFORMANCE: "性能歧义 - 性能指标、优化目标、资源限制不明确",
+    AmbiguityType.SECURITY: "安全歧义 - 权限控制、数据保护、认证授权不明确",
+    AmbiguityType.DEPENDENCY: "依赖歧义 - 外部依赖、版本约束、集成方式不明确",
+    AmbiguityType.UX: "用户体验歧义 - 交互流程、反馈方式、界面行为不明确",
+}
+
+
 def get_type_description(ambiguity_type: AmbiguityType) -> str:
     """获取歧义类型的中文描述。
 
@@ -179,18 +357,7 @@ def get_type_description(ambiguity_type: AmbiguityType) -> str:
     返回：
         类型的中文描述
     """
-    descriptions = {
-        AmbiguityType.SCOPE: "范围歧义 - 功能边界、模块范围、影响范围不明确",
-        AmbiguityType.DATA_STRUCTURE: "数据结构歧义 - 字段定义、类型、关联关系不明确",
-        AmbiguityType.INTERFACE: "接口歧义 - API 设计、参数、返回值不明确",
-        AmbiguityType.VALIDATION: "验证歧义 - 输入校验规则、约束条件不明确",
-        AmbiguityType.ERROR_HANDLING: "错误处理歧义 - 异常处理、降级策略、重试逻辑不明确",
-        AmbiguityType.PERFORMANCE: "性能歧义 - 性能指标、优化目标、资源限制不明确",
-        AmbiguityType.SECURITY: "安全歧义 - 权限控制、数据保护、认证授权不明确",
-        AmbiguityType.DEPENDENCY: "依赖歧义 - 外部依赖、版本约束、集成方式不明确",
-        AmbiguityType.UX: "用户体验歧义 - 交互流程、反馈方式、界面行为不明确",
-    }
-    return descriptions.get(ambiguity_type, ambiguity_type.value)
+    return _TYPE_DESCRIPTIONS.get(ambiguity_type, ambiguity_type.value)
 
 
 def get_all_keywords() -> list[str]:
@@ -199,10 +366,7 @@ def get_all_keywords() -> list[str]:
     返回：
         所有关键词列表
     """
-    keywords = []
-    for kw_list in AMBIGUITY_KEYWORDS.values():
-        keywords.extend(kw_list)
-    return keywords
+    return list(_ALL_KEYWORDS)
 
 
 def get_keywords_by_type(ambiguity_type: AmbiguityType) -> list[str]:
@@ -244,6 +408,8 @@ def is_in_code_block(lines: list[str], line_idx: int) -> bool:
 
     返回：
         True 表示在代码块内，False 表示不在
+
+    注：每次调用都会从头扫描，仅为兼容保留；批量判断请使用 _code_block_mask。
     """
     # 向前扫描，统计代码块标记数量
     code_block_count = 0
@@ -255,7 +421,30 @@ def is_in_code_block(lines: list[str], line_idx: int) -> bool:
     return code_block_count % 2 == 1
 
 
-def filter_false_positives(match: AmbiguityMatch, line: str) -> bool:
+def _code_block_mask(lines: list[str]) -> list[bool]:
+    """一次正向扫描，标记每一行是否位于代码块内。
+
+    与 is_in_code_block 的判定一致（围栏行本身按其之前的标记数判断），
+    但整体为 O(N)，避免逐行从头重扫。
+
+    参数：
+        lines: 文本的所有行列表
+
+    返回：
+        与 lines 等长的布尔列表，True 表示该行在代码块内
+    """
+    mask = [False] * len(lines)
+    inside = False
+    for i, line in enumerate(lines):
+        mask[i] = inside
+        if line.lstrip().startswith("```"):
+            inside = not inside
+    return mask
+
+
+def filter_false_positives(
+    match: AmbiguityMatch, line: str, *, line_lower: str | None = None
+) -> bool:
     """过滤误报，返回 True 表示保留，False 表示过滤。
 
     过滤规则：
@@ -267,52 +456,106 @@ def filter_false_positives(match: AmbiguityMatch, line: str) -> bool:
     参数：
         match: 歧义匹配结果
         line: 原始行内容
+        line_lower: 可选，调用方已算好的 line.lower()，避免同一行多次转换
 
     返回：
         True 保留匹配，False 过滤掉
     """
-    stripped = line.strip()
+    if line_lower is None:
+        line_lower = line.lower()
+    if _line_is_filtered(line, line_lower):
+        return False
+    return not _keyword_in_url_or_code(match.keyword.lower(), line)
+
+
+def _line_is_filtered(line: str, line_lower: str) -> bool:
+    """整行级过滤：与具体关键词无关，同一行只需判断一次。
+
+    参数：
+        line: 原始行内容
+        line_lower: line.lower()
 
+    返回：
+        True 表示该行所有匹配都应过滤（标题行或含否定词）
+    """
     # 跳过 Markdown 标题行
-    if stripped.startswith("#"):
-        return False
+    if line.lstrip().startswith("#"):
+        return True
 
     # 跳过包含否定词的行（如"已定义"、"已确定"）
     # 这些词表示内容已经明确，不应标记为歧义
-    negation_words = [
-        "已定义", "已确定", "已明确", "已指定", "已说明",
-        "已实现", "已完成", "已决定", "确定的", "明确的",
-        "defined", "determined", "specified", "confirmed", "clear",
-        "explicit", "concrete", "precise", "exact", "definite"
-    ]
-    line_lower = line.lower()
-    for negation in negation_words:
-        if negation in line_lower:
-            return False
+    return _NEGATION_RE.search(line_lower) is not None
+
+
+def _keyword_in_url_or_code(keyword_lower: str, line: str) -> bool:
+    """判断关键词是否出现在行内 URL 或行内代码中。
 
+    参数：
+        keyword_lower: 小写关键词
+        line: 原始行内容
+
+    返回：
+        True 表示关键词位于 URL 或 `code` 内，应过滤
+    """
     # 跳过 URL 中的关键词
     if "http://" in line or "https://" in line:
         # 检查关键词是否在 URL 内
-        import re
-        url_pattern = r'https?://[^\s)]+'
-        urls = re.findall(url_pattern, line)
-        for url in urls:
-            if match.keyword.lower() in url.lower():
-                return False
+        for url in _URL_RE.findall(line):
+            if keyword_lower in url.lower():
+                return True
 
     # 跳过行内代码中的关键词
-    # 检测 `code` 格式
-    import re
-    inline_code_pattern = r'`[^`]+`'
-    inline_codes = re.findall(inline_code_pattern, line)
-    for code in inline_codes:
-        if match.keyword.lower() in code.lower():
-            return False
+    # 检测 `code` 格式（行内没有反引号时无需正则）
+    if "`" in line:
+        for code in _INLINE_CODE_RE.findall(line):
+            if keyword_lower in code.lower():
+                return True
+
+    return False
+
 
-    return True
+def _keyword_spans(line_lower: str, keyword_lower: str) -> list[tuple[int, int]]:
+    """返回关键词在行内的全部出现区间（允许重叠）。"""
+    spans = []
+    start = line_lower.find(keyword_lower)
+    while start != -1:
+        spans.append((start, start + len(keyword_lower)))
+        start = line_lower.find(keyword_lower, start + 1)
+    return spans
 
 
-def detect(content: str) -> list[AmbiguityMatch]:
+def _drop_nested_entries(line_lower: str, entry_indices: list[int]) -> list[int]:
+    """去掉同一类型中每次出现都落在更长命中关键词内部的条目。
+
+    参数：
+        line_lower: 已转换为小写的行内容
+        entry_indices: _find_keyword_entries 返回的命中下标
+
+    返回：
+        去重后的命中下标（保持原有顺序）
+    """
+    if len(entry_indices) < 2:
+        return entry_indices
+
+    kept: set[int] = set()
+    covered: dict[AmbiguityType, list[tuple[int, int]]] = {}
+    # 长关键词优先，短关键词只有在存在未被覆盖的出现位置时才保留
+    for entry_idx in sorted(entry_indices, key=_KEYWORD_LENGTH_RANK.__getitem__):
+        ambiguity_type, _, keyword_lower = _KEYWORD_ENTRIES[entry_idx]
+        type_spans = covered.setdefault(ambiguity_type, [])
+        spans = _keyword_spans(line_lower, keyword_lower)
+        if all(
+            any(start >= c_start and end <= c_end for c_start, c_end in type_spans)
+            for start, end in spans
+        ):
+            continue
+        kept.add(entry_idx)
+        type_spans.extend(spans)
+
+    return [idx for idx in entry_indices if idx in kept]
+
+
+def detect(content: str, *, dedup: bool = False) -> list[AmbiguityMatch]:
     """扫描文本内容，检测歧义。
 
     对文本内容进行逐行扫描，使用 AMBIGUITY_KEYWORDS 中的关键词
@@ -332,6 +575,8 @@ def detect(content: str) -> list[AmbiguityMatch]:
 
     参数：
         content: 要扫描的文本内容（通常是 proposal.md）
+        dedup: 为 True 时，同一行同一类型中被更长关键词完全覆盖的短关键词
+            （如 "failure" 中的 "fail"）不再单独报告
 
     返回：
         检测到的歧义匹配列表
@@ -339,28 +584,47 @@ def detect(content: str) -> list[AmbiguityMatch]:
     matches: list[AmbiguityMatch] = []
     lines = content.splitlines()
 
+    in_code = _code_block_mask(lines)
+
     for line_idx, line in enumerate(lines):
-        # 跳过代码块内的行
-        if is_in_code_block(lines, line_idx):
+        # 跳过代码块内的行，以及空行/纯空白行（无需转换小写和正则扫描）
+        if in_code[line_idx] or not line or line.isspace():
+            continue
+
+        # 不区分大小写：每行只转换一次小写，先用并集正则跳过不含关键词的行
+        line_lower = line.lower()
+        if not _KEYWORD_UNION_RE.search(line_lower):
+            continue
+
+        # 标题行、否定词等整行级过滤只与行有关，每行判断一次
+        if _line_is_filtered(line, line_lower):
             continue
 
-        # 对每种歧义类型的关键词进行匹配
-        for ambiguity_type, keywords in AMBIGUITY_KEYWORDS.items():
-            for keyword in keywords:
-                # 不区分大小写的关键词匹配
-                if keyword.lower() in line.lower():
-                    # 创建初步匹配结果
-                    match = AmbiguityMatch(
-                        type=ambiguity_type,
-                        keyword=keyword,
-                        line_number=line_idx + 1,  # 行号从 1 开始
-                        context=get_context(lines, line_idx, context_lines=2),
-                        original_line=line,
-                        confidence=1.0,  # 精确匹配的置信度
-                    )
-
-                    # 过滤误报
-                    if filter_false_positives(match, line):
-                        matches.append(match)
+        # 同一行的所有匹配共享上下文：首个通过过滤的匹配出现时才拼接，且只拼接一次
+        context: str | None = None
+
+        # Aho-Corasick 单次扫描找出全部命中关键词（按关键词表顺序）
+        entry_indices = _find_keyword_entries(line_lower)
+        if dedup:
+            entry_indices = _drop_nested_entries(line_lower, entry_indices)
+        for entry_idx in entry_indices:
+            ambiguity_type, keyword, keyword_lower = _KEYWORD_ENTRIES[entry_idx]
+
+            # 过滤误报：关键词位于 URL 或行内代码中
+            if _keyword_in_url_or_code(keyword_lower, line):
+                continue
+
+            if context is None:
+                context = get_context(lines, line_idx, context_lines=2)
+            matches.append(
+                AmbiguityMatch(
+                    type=ambiguity_type,
+                    keyword=keyword,
+                    line_number=line_idx + 1,  # 行号从 1 开始
+                    context=context,
+                    original_line=line,
+                    confidence=1.0,  # 精确匹配的置信度
+                )
+            )
 
     return matches
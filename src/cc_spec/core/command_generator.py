@@ -9,8 +9,9 @@ v0.1.5 的定位是：
 
 from __future__ import annotations
 
-import re
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 
 from cc_spec.core.command_templates import (
@@ -24,13 +25,35 @@ from cc_spec.core.command_templates import (
     QuickDeltaTemplate,
     SpecifyTemplate,
 )
+from cc_spec.utils.files import atomic_write_text, write_text_if_changed
 
 # 受管理区块标记
 MANAGED_START = "<!-- CC-SPEC:START -->"
 MANAGED_END = "<!-- CC-SPEC:END -->"
 
-# 所有 cc-spec 命令（与 CLI 子命令对齐）
-CC_SPEC_COMMANDS = [
+
+def _find_managed_block(text: str) -> tuple[int, int] | None:
+    """定位第一个受管理区块（含首尾标记）的切片区间。
+
+    标记是固定字面量，直接用 str.find 定位，无需正则。
+
+    参数：
+        text：待查找的文本
+
+    返回：
+        (start, end) 切片区间；未找到完整区块时返回 None
+    """
+    start = text.find(MANAGED_START)
+    if start == -1:
+        return None
+    end = text.find(MANAGED_END, start + len(MANAGED_START))
+    if end == -1:
+        return None
+    return start, end + len(MANAGED_END)
+
+
+# 所有 cc-spec 命令（与 CLI 子命令对齐；只读常量，使用元组）
+CC_SPEC_COMMANDS: tuple[tuple[str, str], ...] = (
     ("init", "初始化/更新知识库（RAG）"),
     ("specify", "创建或编辑变更规格"),
     ("clarify", "审查任务并标记返工"),
@@ -42,7 +65,7 @@ CC_SPEC_COMMANDS = [
     ("list", "列出变更、任务、规格或归档"),
     ("goto", "跳转到指定变更或任务"),
     ("update", "更新配置与模板"),
-]
+)
 
 # 命令到模板的映射（主要命令使用结构化模板）
 COMMAND_TEMPLATES: dict[str, type[CommandTemplate]] = {
@@ -55,6 +78,36 @@ COMMAND_TEMPLATES: dict[str, type[CommandTemplate]] = {
     "quick-delta": QuickDeltaTemplate,
 }
 
+# 模板无状态，每个模板类只实例化一次，按需创建
+_TEMPLATE_INSTANCES: dict[type[CommandTemplate], CommandTemplate] = {}
+
+
+@lru_cache(maxsize=128)
+def _render_template(
+    template_cls: type[CommandTemplate],
+    cmd_name: str,
+    namespace: str,
+    project_root: Path | None,
+) -> str:
+    """渲染命令模板正文（按参数缓存）。
+
+    模板渲染只依赖这几个参数，同一进程内重复生成/更新命令时直接复用结果。
+    """
+    ctx = CommandTemplateContext(
+        command_name=cmd_name,
+        namespace=namespace,
+        project_root=project_root,
+    )
+    template = _TEMPLATE_INSTANCES.get(template_cls)
+    if template is None:
+        template = _TEMPLATE_INSTANCES.setdefault(template_cls, template_cls())
+    return template.render(ctx)
+
+
+def clear_template_cache() -> None:
+    """清空模板渲染缓存（测试或模板变更后使用）。"""
+    _render_template.cache_clear()
+
 
 class CommandGenerator(ABC):
     """命令生成器抽象基类。"""
@@ -65,8 +118,6 @@ class CommandGenerator(ABC):
     file_name_prefix: str = ""
     allowed_tools: str = "Bash, Read, Glob, Grep, TodoWrite, AskUserQuestion"
 
-    _current_project_root: Path | None = None
-
     @abstractmethod
     def get_command_dir(self, project_root: Path) -> Path:
         """获取命令文件应创建到的目录。"""
@@ -79,23 +130,34 @@ class CommandGenerator(ABC):
         project_root: Path,
     ) -> Path | None:
         """生成单个命令文件。"""
-        self._current_project_root = project_root
-
         cmd_dir = self.get_command_dir(project_root)
         cmd_dir.mkdir(parents=True, exist_ok=True)
 
         if self.file_format == "toml":
-            return self._write_toml_command(cmd_dir, cmd_name, description)
-        return self._write_md_command(cmd_dir, cmd_name, description)
+            return self._write_toml_command(cmd_dir, cmd_name, description, project_root)
+        return self._write_md_command(cmd_dir, cmd_name, description, project_root)
 
     def generate_all(self, project_root: Path) -> list[Path]:
-        """生成全部命令文件。"""
-        created: list[Path] = []
-        for cmd_name, description in CC_SPEC_COMMANDS:
-            path = self.generate_command(cmd_name, description, project_root)
-            if path:
-                created.append(path)
-        return created
+        """生成全部命令文件。
+
+        目录只创建一次；各命令文件彼此独立，交给线程池并发写入，结果保持命令顺序。
+        """
+        cmd_dir = self.get_command_dir(project_root)
+        cmd_dir.mkdir(parents=True, exist_ok=True)
+
+        write = (
+            self._write_toml_command
+            if self.file_format == "toml"
+            else self._write_md_command
+        )
+        with ThreadPoolExecutor(max_workers=min(8, len(CC_SPEC_COMMANDS))) as executor:
+            paths = list(
+                executor.map(
+                    lambda command: write(cmd_dir, *command, project_root),
+                    CC_SPEC_COMMANDS,
+                )
+            )
+        return [path for path in paths if path]
 
     def update_command(
         self,
@@ -103,8 +165,26 @@ class CommandGenerator(ABC):
         description: str,
         project_root: Path,
     ) -> Path | None:
-        """更新已有命令文件，并保留用户自定义内容（受管理区块外）。"""
-        self._current_project_root = project_root
+        """更新已有命令文件，并保留用户自定义内容（受管理区块外）。
+
+        不修改生成器实例状态，可在多个线程中对同一生成器并发调用。
+        """
+        return self.update_command_status(cmd_name, description, project_root)[0]
+
+    def update_command_status(
+        self,
+        cmd_name: str,
+        description: str,
+        project_root: Path,
+    ) -> tuple[Path | None, bool]:
+        """更新命令文件，并报告是否实际写入了磁盘。
+
+        行为与 update_command 相同；额外返回的布尔值让调用方区分
+        "内容已更新" 与 "文件已存在且内容未变"。
+
+        返回：
+            (文件路径, 是否写入)；文件缺少受管理区块时返回 (None, False)
+        """
         cmd_dir = self.get_command_dir(project_root)
 
         file_stem = self._get_command_file_stem(cmd_name)
@@ -113,21 +193,26 @@ class CommandGenerator(ABC):
         else:
             file_path = cmd_dir / f"{file_stem}.md"
 
-        if not file_path.exists():
-            return self.generate_command(cmd_name, description, project_root)
+        # 直接读取，文件不存在时再生成，避免 exists() 与读取各做一次系统调用
+        try:
+            existing = file_path.read_text(encoding="utf-8")
+        except FileNotFoundError:
+            return self.generate_command(cmd_name, description, project_root), True
 
-        existing = file_path.read_text(encoding="utf-8")
         if MANAGED_START not in existing:
-            return None
+            return None, False
 
         new_content = (
-            self._get_toml_content(cmd_name, description)
+            self._get_toml_content(cmd_name, description, project_root)
             if self.file_format == "toml"
-            else self._get_md_content(cmd_name, description)
+            else self._get_md_content(cmd_name, description, project_root)
         )
         updated = self._update_managed_block(existing, new_content)
-        file_path.write_text(updated, encoding="utf-8")
-        return file_path
+        # 受管理区块内容未变化时不重写，保持 mtime 不变
+        if updated == existing:
+            return file_path, False
+        atomic_write_text(file_path, updated)
+        return file_path, True
 
     def _get_command_file_stem(self, cmd_name: str) -> str:
         return f"{self.file_name_prefix}{cmd_name}"
@@ -137,9 +222,13 @@ class CommandGenerator(ABC):
         cmd_dir: Path,
         cmd_name: str,
         description: str,
+        project_root: Path | None,
     ) -> Path:
         file_path = cmd_dir / f"{self._get_command_file_stem(cmd_name)}.md"
-        file_path.write_text(self._get_md_content(cmd_name, description), encoding="utf-8")
+        # 内容未变化时不重写，保持 mtime 不变
+        write_text_if_changed(
+            file_path, self._get_md_content(cmd_name, description, project_root)
+        )
         return file_path
 
     def _write_toml_command(
@@ -147,21 +236,23 @@ class CommandGenerator(ABC):
         cmd_dir: Path,
         cmd_name: str,
         description: str,
+        project_root: Path | None,
     ) -> Path:
         file_path = cmd_dir / f"{self._get_command_file_stem(cmd_name)}.toml"
-        file_path.write_text(self._get_toml_content(cmd_name, description), encoding="utf-8")
+        # 内容未变化时不重写，保持 mtime 不变
+        write_text_if_changed(
+            file_path, self._get_toml_content(cmd_name, description, project_root)
+        )
         return file_path
 
-    def _get_md_content(self, cmd_name: str, description: str) -> str:
+    def _get_md_content(
+        self, cmd_name: str, description: str, project_root: Path | None
+    ) -> str:
         template_cls = COMMAND_TEMPLATES.get(cmd_name)
         if template_cls:
-            ctx = CommandTemplateContext(
-                command_name=cmd_name,
-                namespace=self.namespace,
-                project_root=self._current_project_root,
+            template_content = _render_template(
+                template_cls, cmd_name, self.namespace, project_root
             )
-            template = template_cls()
-            template_content = template.render(ctx)
             body = f"{MANAGED_START}\n{template_content}\n{MANAGED_END}"
         else:
             body = (
@@ -185,16 +276,14 @@ allowed-tools: {self.allowed_tools}
 {body}
 """
 
-    def _get_toml_content(self, cmd_name: str, description: str) -> str:
+    def _get_toml_content(
+        self, cmd_name: str, description: str, project_root: Path | None
+    ) -> str:
         template_cls = COMMAND_TEMPLATES.get(cmd_name)
         if template_cls:
-            ctx = CommandTemplateContext(
-                command_name=cmd_name,
-                namespace=self.namespace,
-                project_root=self._current_project_root,
+            content = _render_template(
+                template_cls, cmd_name, self.namespace, project_root
             )
-            template = template_cls()
-            content = template.render(ctx)
         else:
             content = f"运行 `cc-spec {cmd_name} $ARGUMENTS`"
 
@@ -207,21 +296,16 @@ allowed_tools = "{self.allowed_tools}"
 """
 
     def _update_managed_block(self, existing: str, new_content: str) -> str:
-        new_match = re.search(
-            rf"{re.escape(MANAGED_START)}.*?{re.escape(MANAGED_END)}",
-            new_content,
-            re.DOTALL,
-        )
-        if not new_match:
+        new_span = _find_managed_block(new_content)
+        if new_span is None:
+            return existing
+        old_span = _find_managed_block(existing)
+        if old_span is None:
             return existing
 
-        new_block = new_match.group(0)
-        return re.sub(
-            rf"{re.escape(MANAGED_START)}.*?{re.escape(MANAGED_END)}",
-            new_block,
-            existing,
-            flags=re.DOTALL,
-        )
+        # 纯字符串拼接：新区块中的反斜杠等字符原样保留
+        new_block = new_content[new_span[0] : new_span[1]]
+        return existing[: old_span[0]] + new_block + existing[old_span[1] :]
 
 
 class ClaudeCommandGenerator(CommandGenerator):
@@ -232,7 +316,8 @@ class ClaudeCommandGenerator(CommandGenerator):
     allowed_tools = "Bash, Read, Glob, Grep, TodoWrite, AskUserQuestion"
 
     def get_command_dir(self, project_root: Path) -> Path:
-        return project_root / ".claude" / "commands" / self.namespace
+        # joinpath 一次拼接多段，只构造一个 Path 对象
+        return project_root.joinpath(".claude", "commands", self.namespace)
 
 
 COMMAND_GENERATORS: dict[str, type[CommandGenerator]] = {
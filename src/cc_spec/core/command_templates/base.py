@@ -19,7 +19,7 @@ class RenderFormat(Enum):
     TOML = "toml"
 
 
-@dataclass
+@dataclass(slots=True)
 class CommandTemplateContext:
     """命令模板的渲染上下文。
 
@@ -189,10 +189,11 @@ class CommandTemplate(ABC):
     def _render_toml(self, ctx: CommandTemplateContext) -> str:
         """渲染 TOML 格式的模板。"""
         md_content = self._render_markdown(ctx)
-        # TOML 格式需要将内容包装在多行字符串中
-        escaped_content = md_content.replace('"""', '\\"\\"\\"')
-        return f'''[prompt]
-content = """
-{escaped_content}
-"""
-'''
+        # 优先使用 TOML 多行字面量字符串：内容原样保留，无需逐字符转义
+        if "'''" not in md_content:
+            return f"[prompt]\ncontent = '''\n{md_content}\n'''\n"
+        # 内容本身含 ''' 时退回多行基本字符串，按 TOML 规则转义反斜杠与三引号
+        escaped_content = md_content.replace("\\", "\\\\").replace(
+            '"""', '\\"\\"\\"'
+        )
+        return f'[prompt]\ncontent = """\n{escaped_content}\n"""\n'
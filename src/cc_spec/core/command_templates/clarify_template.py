@@ -10,11 +10,41 @@
 参考：Spec-Kit 的 clarify 工作流设计
 """
 
+from functools import lru_cache
+
 from ..ambiguity import AmbiguityType
 from ..ambiguity.detector import get_keywords_by_type, get_type_description
 from .base import CommandTemplate, CommandTemplateContext
 
 
+@lru_cache(maxsize=None)
+def _classification_rows() -> tuple[str, ...]:
+    """生成歧义分类表的各行。
+
+    关键词与类型描述均为模块级常量，结果只需计算一次；
+    返回元组避免调用方修改缓存内容。
+
+    返回：
+        每种歧义类型对应的一行 Markdown 表格
+    """
+    rows = []
+    for ambiguity_type in AmbiguityType:
+        keywords = get_keywords_by_type(ambiguity_type)
+        # 关键词要么是纯 ASCII 英文，要么包含中文，用 C 实现的 isascii 区分即可
+        cn_keywords = [k for k in keywords if not k.isascii()][:5]
+        en_keywords = [k for k in keywords if k.isascii()][:5]
+
+        type_desc = get_type_description(ambiguity_type)
+        # 提取描述的简短版本（去掉具体说明）
+        short_desc = type_desc.split(" - ")[0] if " - " in type_desc else type_desc
+
+        rows.append(
+            f"| **{ambiguity_type.value.upper()}** | {short_desc} | "
+            f"{', '.join(cn_keywords)} | {', '.join(en_keywords)} |"
+        )
+    return tuple(rows)
+
+
 class ClarifyTemplate(CommandTemplate):
     """clarify 命令的模板实现。
 
@@ -270,20 +300,8 @@ class ClarifyTemplate(CommandTemplate):
             "|------|------|-------------------|-------------------|",
         ]
 
-        # 为每种歧义类型生成表格行
-        for ambiguity_type in AmbiguityType:
-            keywords = get_keywords_by_type(ambiguity_type)
-            cn_keywords = [k for k in keywords if any('\u4e00' <= c <= '\u9fff' for c in k)][:5]
-            en_keywords = [k for k in keywords if not any('\u4e00' <= c <= '\u9fff' for c in k)][:5]
-
-            type_desc = get_type_description(ambiguity_type)
-            # 提取描述的简短版本（去掉具体说明）
-            short_desc = type_desc.split(" - ")[0] if " - " in type_desc else type_desc
-
-            guidelines.append(
-                f"| **{ambiguity_type.value.upper()}** | {short_desc} | "
-                f"{', '.join(cn_keywords)} | {', '.join(en_keywords)} |"
-            )
+        # 为每种歧义类型生成表格行（由静态数据推导，进程内只计算一次）
+        guidelines.extend(_classification_rows())
 
         guidelines.extend([
             "",
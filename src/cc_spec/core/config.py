@@ -17,6 +17,11 @@ import yaml
 
 from cc_spec.version import CONFIG_VERSION, is_version_gte
 
+# 优先使用 libyaml 的 C 实现（解析/输出更快），未编译 libyaml 时回退到纯 Python 版本
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+
 class Dimension(Enum):
     """四维评分机制的评分维度。"""
 
@@ -650,6 +655,7 @@ class Config:
         checklist：Checklist 验证配置
         scoring：四维评分配置
         lock：分布式锁配置
+        raw_data：load_config 读到的原始 YAML 字典（保留未知字段；非文件来源时为 None）
     """
 
     version: str = CONFIG_VERSION
@@ -667,6 +673,9 @@ class Config:
     scoring: ScoringConfig = field(default_factory=ScoringConfig)
     lock: LockConfig = field(default_factory=LockConfig)
     kb: KBConfig = field(default_factory=KBConfig)
+    raw_data: dict[str, Any] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def get_active_agent(self) -> str:
         """获取当前激活的 AI agent。
@@ -810,13 +819,15 @@ def load_config(config_path: Path) -> Config:
     if not config_path.exists():
         raise FileNotFoundError(f"未找到配置文件：{config_path}")
 
-    with open(config_path, "r", encoding="utf-8") as f:
-        data = yaml.safe_load(f)
+    data = yaml.load(config_path.read_bytes(), Loader=_YAML_LOADER)
 
     if data is None:
         data = {}
 
-    return Config.from_dict(data)
+    config = Config.from_dict(data)
+    # 保留原始字典，供需要保留原始结构的调用方（如 update）复用，免去二次读取解析
+    config.raw_data = data
+    return config
 
 
 def save_config(config: Config, config_path: Path) -> None:
@@ -831,14 +842,40 @@ def save_config(config: Config, config_path: Path) -> None:
     """
     config_path.parent.mkdir(parents=True, exist_ok=True)
 
-    with open(config_path, "w", encoding="utf-8") as f:
-        yaml.safe_dump(
+    config_path.write_bytes(
+        yaml.dump(
             config.to_dict(),
-            f,
+            Dumper=_YAML_DUMPER,
             default_flow_style=False,
             sort_keys=False,
             allow_unicode=True,
+            encoding="utf-8",
         )
+    )
+
+
+# 与 init.py / command_generator.py 生成的目录结构对齐
+# 注：字典顺序即优先级（检测到第一个即返回）
+_AGENT_MARKERS: dict[str, str] = {
+    ".claude": "claude",
+    ".cursor": "cursor",
+    ".gemini": "gemini",
+    ".github/prompts": "copilot",
+    ".amazonq": "amazonq",
+    ".windsurf": "windsurf",
+    ".qwen": "qwen",
+    ".codeium": "codeium",
+    ".continue": "continue",
+    ".tabnine": "tabnine",
+    ".aider": "aider",
+    ".devin": "devin",
+    ".replit": "replit",
+    ".cody": "cody",
+    ".supermaven": "supermaven",
+    ".kilo": "kilo",
+    ".auggie": "auggie",
+    ".codex": "codex",
+}
 
 
 def detect_agent(project_root: Path) -> str:
@@ -850,30 +887,7 @@ def detect_agent(project_root: Path) -> str:
     返回：
         检测到的 agent 类型（"claude"、"cursor"、"gemini" 等），或 "unknown"
     """
-    # 与 init.py / command_generator.py 生成的目录结构对齐
-    # 注：字典顺序即优先级（检测到第一个即返回）
-    agent_markers = {
-        ".claude": "claude",
-        ".cursor": "cursor",
-        ".gemini": "gemini",
-        ".github/prompts": "copilot",
-        ".amazonq": "amazonq",
-        ".windsurf": "windsurf",
-        ".qwen": "qwen",
-        ".codeium": "codeium",
-        ".continue": "continue",
-        ".tabnine": "tabnine",
-        ".aider": "aider",
-        ".devin": "devin",
-        ".replit": "replit",
-        ".cody": "cody",
-        ".supermaven": "supermaven",
-        ".kilo": "kilo",
-        ".auggie": "auggie",
-        ".codex": "codex",
-    }
-
-    for marker, agent_type in agent_markers.items():
+    for marker, agent_type in _AGENT_MARKERS.items():
         marker_path = project_root / marker
         if marker_path.exists():
             return agent_type
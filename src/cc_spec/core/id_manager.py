@@ -161,6 +161,8 @@ class IDManager:
         self.cc_spec_root = cc_spec_root
         self.id_map_path = cc_spec_root / "id-map.yaml"
         self._id_map: IDMap = self._load_id_map()
+        # 变更名称 -> change_id 的索引，首次按名称查找时构建，变更注册表时失效
+        self._name_index: dict[str, str] | None = None
 
     def _load_id_map(self) -> IDMap:
         """从文件加载 ID map；若不存在则创建新的。
@@ -242,6 +244,23 @@ class IDManager:
                     created=datetime.now().isoformat(),
                 )
 
+    def _find_change_id_by_name(self, name: str) -> str | None:
+        """通过名称查找变更 ID（基于惰性构建的名称索引）。
+
+        参数：
+            name：要查找的变更名称
+
+        返回：
+            找到则返回 change_id，否则返回 None
+        """
+        if self._name_index is None:
+            index: dict[str, str] = {}
+            for change_id, entry in self._id_map.changes.items():
+                # 名称重复时保留第一个，与原先的线性查找语义一致
+                index.setdefault(entry.name, change_id)
+            self._name_index = index
+        return self._name_index.get(name)
+
     def generate_change_id(self) -> str:
         """生成新的唯一 change ID。
 
@@ -333,15 +352,15 @@ class IDManager:
         返回：
             找到则返回 ParsedID，否则返回 None
         """
-        for change_id, entry in self._id_map.changes.items():
-            if entry.name == name:
-                return ParsedID(
-                    type=IDType.CHANGE,
-                    change_id=change_id,
-                    task_id=None,
-                    full_id=change_id,
-                )
-        return None
+        change_id = self._find_change_id_by_name(name)
+        if change_id is None:
+            return None
+        return ParsedID(
+            type=IDType.CHANGE,
+            change_id=change_id,
+            task_id=None,
+            full_id=change_id,
+        )
 
     def resolve_path(self, id_str: str) -> Path | None:
         """将 ID 解析为对应的文件系统路径。
@@ -407,6 +426,7 @@ class IDManager:
             path=str(rel_path).replace("\\", "/"),
             created=datetime.now().isoformat(),
         )
+        self._name_index = None
 
         self._save_id_map()
         return change_id
@@ -484,6 +504,7 @@ class IDManager:
         """
         if change_id in self._id_map.changes:
             del self._id_map.changes[change_id]
+            self._name_index = None
             self._save_id_map()
             return True
         return False
@@ -508,10 +529,10 @@ class IDManager:
         返回：
             找到则返回 (change_id, entry)，否则返回 None
         """
-        for change_id, entry in self._id_map.changes.items():
-            if entry.name == name:
-                return (change_id, entry)
-        return None
+        change_id = self._find_change_id_by_name(name)
+        if change_id is None:
+            return None
+        return (change_id, self._id_map.changes[change_id])
 
     def list_changes(self) -> dict[str, ChangeEntry]:
         """列出所有已注册的变更。
@@ -571,6 +592,7 @@ class IDManager:
         当 id-map.yaml 损坏时可用于恢复。
         """
         self._id_map = IDMap()
+        self._name_index = None
         self._scan_existing_changes(self._id_map)
 
         # 同时扫描 specs 目录
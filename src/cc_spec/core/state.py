@@ -11,6 +11,8 @@ from typing import Any
 
 import yaml
 
+from cc_spec.utils.files import atomic_write_text
+
 
 class Stage(Enum):
     """变更的工作流阶段。"""
@@ -216,10 +218,9 @@ def update_state(state_path: Path, state: ChangeState) -> None:
         "tasks": tasks_list,
     }
 
-    # 写入文件
-    state_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(state_path, "w", encoding="utf-8") as f:
-        yaml.dump(data, f, default_flow_style=False, allow_unicode=True, sort_keys=False)
+    # 原子写入文件，避免中断时留下损坏的 status.yaml
+    content = yaml.dump(data, default_flow_style=False, allow_unicode=True, sort_keys=False)
+    atomic_write_text(state_path, content)
 
 
 def get_current_change(cc_spec_root: Path) -> ChangeState | None:
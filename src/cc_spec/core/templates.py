@@ -4,6 +4,7 @@ import asyncio
 import os
 import re
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Optional
 
@@ -173,11 +174,13 @@ def copy_template(
         source_dir = get_template_cache_dir()
 
     template_path = source_dir / template_name
-    if not template_path.exists():
+    try:
+        stat = template_path.stat()
+    except OSError:
         raise TemplateError(f"未找到模板：{template_name}")
 
-    # 读取模板内容
-    template_content = template_path.read_text(encoding="utf-8")
+    # 读取模板内容（按路径 + mtime + size 缓存，文件变化后自动失效）
+    template_content = _load_template_source(template_path, stat.st_mtime_ns, stat.st_size)
 
     # 如提供变量则渲染替换
     if variables:
@@ -192,6 +195,15 @@ def copy_template(
     return dest_path
 
 
+@lru_cache(maxsize=16)
+def _load_template_source(template_path: Path, mtime_ns: int, size: int) -> str:
+    """读取模板源文件内容。
+
+    mtime_ns 与 size 仅作为缓存键的一部分，用于在模板文件被更新后重新读取。
+    """
+    return template_path.read_text(encoding="utf-8")
+
+
 def list_templates(source_dir: Optional[Path] = None) -> List[str]:
     """列出可用的模板文件。
 
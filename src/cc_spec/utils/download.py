@@ -10,6 +10,7 @@ async def download_file(
     dest_path: Path,
     timeout: float = 30.0,
     follow_redirects: bool = True,
+    client: httpx.AsyncClient | None = None,
 ) -> bool:
     """
     从 URL 下载文件到指定目标路径。
@@ -19,6 +20,8 @@ async def download_file(
         dest_path: 目标文件路径
         timeout: 请求超时时间（秒）
         follow_redirects: 是否跟随 HTTP 重定向
+        client: 可选的共享客户端；批量下载同一主机的文件时传入，
+            可复用连接池与 TLS 会话（此时忽略 timeout/follow_redirects）
 
     返回：
         bool: 下载成功返回 True，否则返回 False
@@ -27,18 +30,21 @@ async def download_file(
         httpx.HTTPError: HTTP 请求失败时抛出
     """
     try:
-        async with httpx.AsyncClient(
-            timeout=timeout, follow_redirects=follow_redirects
-        ) as client:
+        if client is None:
+            async with httpx.AsyncClient(
+                timeout=timeout, follow_redirects=follow_redirects
+            ) as own_client:
+                response = await own_client.get(url)
+        else:
             response = await client.get(url)
-            response.raise_for_status()
+        response.raise_for_status()
 
-            # 确保父目录存在
-            dest_path.parent.mkdir(parents=True, exist_ok=True)
+        # 确保父目录存在
+        dest_path.parent.mkdir(parents=True, exist_ok=True)
 
-            # 将内容写入文件
-            dest_path.write_bytes(response.content)
-            return True
+        # 将内容写入文件
+        dest_path.write_bytes(response.content)
+        return True
 
     except (httpx.HTTPError, OSError) as e:
         # 记录错误但不抛出异常——由调用方处理回退逻辑
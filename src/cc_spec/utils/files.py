@@ -3,6 +3,11 @@
 本模块提供文件与目录操作的辅助函数。
 """
 
+import filecmp
+import os
+import shutil
+import stat
+import tempfile
 from pathlib import Path
 from typing import Optional
 
@@ -16,6 +21,118 @@ def ensure_dir(path: Path) -> None:
     path.mkdir(parents=True, exist_ok=True)
 
 
+def atomic_write_text(path: Path, content: str, encoding: str = "utf-8") -> None:
+    """原子地写入文本文件。
+
+    先一次性写入同目录下的临时文件，再通过 os.replace 替换目标文件，
+    避免进程中断时留下写了一半的文件。
+
+    参数：
+        path: 目标文件路径
+        content: 文件内容
+        encoding: 文本编码
+    """
+    atomic_write_bytes(path, content.encode(encoding))
+
+
+def _current_umask() -> int:
+    """读取当前进程的 umask（os.umask 只能"设置并返回旧值"，读取后立即还原）。"""
+    mask = os.umask(0)
+    os.umask(mask)
+    return mask
+
+
+# 新建文件的默认权限位（与 open() 创建文件时一致：0o666 去掉 umask）
+_DEFAULT_FILE_MODE = 0o666 & ~_current_umask()
+
+
+def atomic_write_bytes(path: Path, data: bytes) -> None:
+    """原子地写入二进制文件。
+
+    在目标目录下用 mkstemp 创建唯一命名的临时文件，直接通过其文件描述符写入，
+    再通过 os.replace 替换目标文件；多个进程/线程同时写同一文件时各用各的临时文件，
+    互不截断也不会删除对方的临时文件。目标文件已存在时沿用其权限位；
+    写入或替换失败时删除临时文件，不留下 *.tmp 残留。
+
+    参数：
+        path: 目标文件路径
+        data: 文件内容
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        mode = stat.S_IMODE(path.stat().st_mode)
+    except FileNotFoundError:
+        mode = _DEFAULT_FILE_MODE
+
+    # mkstemp 以二进制模式打开（Windows 下带 O_BINARY，不做 \n -> \r\n 转换）
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=path.name, suffix=".tmp")
+    tmp = Path(tmp_name)
+    try:
+        try:
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view) :]
+        finally:
+            os.close(fd)
+        # mkstemp 创建的文件权限为 0o600，替换前改为目标应有的权限
+        os.chmod(tmp, mode)
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
+def write_text_if_changed(path: Path, content: str, encoding: str = "utf-8") -> bool:
+    """仅当内容与现有文件不同时才（原子地）写入文本文件。
+
+    内容一致时不产生任何写操作，文件 mtime 保持不变，
+    避免触发编辑器/文件监听器的无谓重载。
+
+    参数：
+        path: 目标文件路径
+        content: 文件内容
+        encoding: 文本编码
+
+    返回：
+        发生写入返回 True；内容已一致返回 False
+    """
+    # 只编码一次，比较与写入共用同一份字节
+    data = content.encode(encoding)
+    try:
+        if path.read_bytes() == data:
+            return False
+    except OSError:
+        pass
+    atomic_write_bytes(path, data)
+    return True
+
+
+def copy_if_changed(source: Path, dest: Path) -> bool:
+    """仅当目标文件与源文件内容不同时才复制。
+
+    先比较文件大小，大小一致时再用 filecmp 按块比较内容，
+    避免把两份文件整个读入内存。
+
+    参数：
+        source: 源文件路径
+        dest: 目标文件路径
+
+    返回：
+        发生复制返回 True；内容已一致返回 False
+    """
+    try:
+        if dest.stat().st_size == source.stat().st_size and filecmp.cmp(
+            source, dest, shallow=False
+        ):
+            return False
+    except OSError:
+        # 目标不存在或不可读，直接覆盖
+        pass
+
+    shutil.copy2(source, dest)
+    return True
+
+
 def find_project_root(start_path: Optional[Path] = None) -> Optional[Path]:
     """通过查找 .cc-spec 目录来定位项目根目录。
 
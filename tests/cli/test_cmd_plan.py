@@ -289,6 +289,23 @@ tasks:
         assert task_map["02-MODEL"]["status"] == "in_progress"
         assert task_map["03-API"]["status"] == "completed"
 
+    def test_create_basic_tasks_yaml_quotes_change_name(self) -> None:
+        """Test basic tasks.yaml stays valid YAML for special change names."""
+        from cc_spec.commands.plan import _create_basic_tasks_yaml
+
+        change_name = 'fix: "login" #1'
+        tasks_path = self.project_root / "tasks.yaml"
+        _create_basic_tasks_yaml(tasks_path, change_name)
+
+        content = read_yaml(tasks_path)
+        assert content["version"] == "1.6"
+        assert content["change"] == change_name
+        setup = content["tasks"]["01-SETUP"]
+        assert setup["wave"] == 0
+        assert setup["deps"] == []
+        assert setup["docs"] == [f".cc-spec/changes/{change_name}/proposal.md"]
+        assert len(setup["checklist"]) == 4
+
 
 class TestPlanIntegration:
     """Integration tests for plan command workflow."""
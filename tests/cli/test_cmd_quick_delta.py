@@ -1,11 +1,13 @@
 """Unit tests for quick-delta command."""
 
 import os
+import re
 from datetime import datetime
 from pathlib import Path
 from unittest.mock import patch
 
 import pytest
+from rich.console import Console
 from typer.testing import CliRunner
 
 from helpers import assert_contains_any
@@ -66,8 +68,13 @@ class TestQuickDeltaCommand:
 
         change_dir = change_dirs[0]
         # Verify format: quick-YYYYMMDD-HHMMSS-{slug}
-        assert change_dir.name.startswith("quick-")
-        assert "update-config" in change_dir.name
+        assert re.fullmatch(r"quick-\d{8}-\d{6}-update-config", change_dir.name)
+
+        # mini-proposal 中的可读时间与变更名称中的时间戳一致
+        stamp = change_dir.name.split("-")
+        content = (change_dir / "mini-proposal.md").read_text(encoding="utf-8")
+        created = datetime.strptime(stamp[1] + stamp[2], "%Y%m%d%H%M%S")
+        assert created.strftime("%Y-%m-%d %H:%M:%S") in content
 
     def test_quick_delta_creates_mini_proposal(self) -> None:
         """Test quick-delta command creates mini-proposal.md."""
@@ -132,6 +139,82 @@ class TestQuickDeltaCommand:
             # Git might not be available in CI/CD environment
             pytest.skip(f"Git not available: {e}")
 
+    def test_quick_delta_shortstat_probe_exceeds_threshold(self) -> None:
+        """Test quick-delta bails out on the shortstat probe alone."""
+        with (
+            patch(
+                "cc_spec.commands.quick_delta._diff_shortstat",
+                return_value=(42, 100, 10),
+            ),
+            patch("cc_spec.commands.quick_delta._count_changed_files") as mock_count,
+        ):
+            result = runner.invoke(app, ["quick-delta", "Huge change"])
+
+        assert result.exit_code == 1
+        assert "42" in result.stdout
+        mock_count.assert_not_called()
+        assert not list(self.archive_dir.glob("quick-*"))
+
+    def test_quick_delta_counts_untracked_with_shortstat(self) -> None:
+        """Test tracked (shortstat) and untracked counts add up for the gate."""
+        with (
+            patch(
+                "cc_spec.commands.quick_delta._diff_shortstat",
+                return_value=(3, 10, 2),
+            ),
+            patch(
+                "cc_spec.commands.quick_delta._count_untracked_files",
+                return_value=4,
+            ),
+            patch("cc_spec.commands.quick_delta._count_changed_files") as mock_count,
+        ):
+            result = runner.invoke(app, ["quick-delta", "Mixed change"])
+
+        assert result.exit_code == 1
+        assert "7" in result.stdout
+        mock_count.assert_not_called()
+
+    def test_quick_delta_outside_git_repo_skips_git_queries(self) -> None:
+        """Test quick-delta probes the repo once and skips other git calls."""
+        with (
+            patch("cc_spec.commands.quick_delta._diff_shortstat", return_value=None),
+            patch("cc_spec.commands.quick_delta._is_git_repo", return_value=False),
+            patch("cc_spec.commands.quick_delta._count_changed_files") as mock_count,
+            patch("cc_spec.commands.quick_delta._get_git_info") as mock_info,
+            patch("cc_spec.commands.quick_delta._parse_git_diff") as mock_diff,
+        ):
+            result = runner.invoke(app, ["quick-delta", "No repo"])
+
+        assert result.exit_code == 0
+        mock_count.assert_not_called()
+        mock_info.assert_not_called()
+        mock_diff.assert_not_called()
+        assert list(self.archive_dir.glob("quick-*-no-repo"))
+
+    def test_quick_delta_skips_banner_when_not_terminal(self) -> None:
+        """Test the banner is not rendered for piped (non-TTY) output."""
+        with patch("cc_spec.ui.banner.show_banner") as mock_banner:
+            result = runner.invoke(app, ["quick-delta", "Piped run"])
+
+        assert result.exit_code == 0
+        mock_banner.assert_not_called()
+
+    def test_quiet_option_disables_banner(self) -> None:
+        """Test --quiet hides the banner for that invocation only."""
+        env_before = dict(os.environ)
+        with (
+            patch("cc_spec.commands.quick_delta.console", Console(force_terminal=True)),
+            patch("cc_spec.ui.banner.show_banner") as mock_banner,
+        ):
+            result = runner.invoke(app, ["--quiet", "quick-delta", "Quiet run"])
+            assert result.exit_code == 0
+            mock_banner.assert_not_called()
+            assert dict(os.environ) == env_before
+
+            result = runner.invoke(app, ["quick-delta", "Loud run"])
+            assert result.exit_code == 0
+            mock_banner.assert_called_once()
+
     def test_quick_delta_slug_generation(self) -> None:
         """Test quick-delta command generates proper slug from message."""
         os.chdir(str(self.project_root))
@@ -1,11 +1,15 @@
 """Tests for the update command (v0.1.6)."""
 
+import copy
+from pathlib import Path
 from unittest.mock import AsyncMock, patch
 
 from typer.testing import CliRunner
 
 from helpers import assert_contains_any, read_yaml, write_yaml
 from cc_spec import app
+from cc_spec.commands import update as update_module
+from cc_spec.core.command_generator import CC_SPEC_COMMANDS
 from cc_spec.core.config import Config, save_config
 from cc_spec.utils.files import get_cc_spec_dir
 
@@ -44,6 +48,34 @@ class TestUpdateCommand:
         assert cmd_dir.exists()
         assert (cmd_dir / "specify.md").exists()
 
+    def test_update_commands_counts_created_then_updated(self, tmp_path, monkeypatch) -> None:
+        monkeypatch.chdir(tmp_path)
+
+        cc_spec_dir = get_cc_spec_dir(tmp_path)
+        cc_spec_dir.mkdir(parents=True)
+        save_config(Config(project_name="test"), cc_spec_dir / "config.yaml")
+        total = len(CC_SPEC_COMMANDS)
+
+        first = runner.invoke(app, ["update", "commands"])
+        second = runner.invoke(app, ["update", "commands"])
+
+        assert first.exit_code == 0
+        assert f"created={total} updated=0" in first.stdout
+        assert second.exit_code == 0
+        assert "created=0 updated=0" in second.stdout
+        assert "Nothing to update" in second.stdout
+
+        # 只改动一个命令的受管理区块，第二次之后的更新只计这一个
+        specify_path = tmp_path / ".claude" / "commands" / "cc-spec" / "specify.md"
+        specify_path.write_text(
+            specify_path.read_text(encoding="utf-8").replace("## User Input", "## Stale", 1),
+            encoding="utf-8",
+        )
+        third = runner.invoke(app, ["update", "commands"])
+        assert third.exit_code == 0
+        assert "created=0 updated=1" in third.stdout
+        assert "Nothing to update" not in third.stdout
+
     def test_update_templates_creates_templates_dir(self, tmp_path, monkeypatch) -> None:
         monkeypatch.chdir(tmp_path)
 
@@ -58,6 +90,71 @@ class TestUpdateCommand:
         assert result.exit_code == 0
         assert (cc_spec_dir / "templates").exists()
 
+    def test_update_templates_fallback_skips_identical_files(
+        self, tmp_path, monkeypatch
+    ) -> None:
+        import os
+
+        from cc_spec.commands.update import TEMPLATE_FILES
+
+        monkeypatch.chdir(tmp_path)
+
+        cc_spec_dir = get_cc_spec_dir(tmp_path)
+        cc_spec_dir.mkdir(parents=True)
+        save_config(Config(project_name="test"), cc_spec_dir / "config.yaml")
+
+        # 目标模板已与内置模板一致：强制更新时不应重写该文件
+        bundled = Path(update_module.__file__).parent.parent / "templates" / TEMPLATE_FILES[0]
+        dest = cc_spec_dir / "templates" / TEMPLATE_FILES[0]
+        dest.parent.mkdir(parents=True)
+        dest.write_bytes(bundled.read_bytes())
+        os.utime(dest, (1_000_000, 1_000_000))
+
+        with patch("cc_spec.commands.update.download_file", new_callable=AsyncMock) as mock_download:
+            mock_download.return_value = False
+            result = runner.invoke(app, ["update", "--templates", "--force"])
+
+        assert result.exit_code == 0
+        assert dest.stat().st_mtime == 1_000_000
+
+    def test_update_templates_downloads_concurrently_with_fallback(
+        self, tmp_path, monkeypatch
+    ) -> None:
+        from cc_spec.commands.update import TEMPLATE_FILES
+
+        monkeypatch.chdir(tmp_path)
+
+        cc_spec_dir = get_cc_spec_dir(tmp_path)
+        cc_spec_dir.mkdir(parents=True)
+        save_config(Config(project_name="test"), cc_spec_dir / "config.yaml")
+
+        failing = TEMPLATE_FILES[0]
+        urls: list[str] = []
+        clients: list[object] = []
+
+        async def fake_download(url, dest_path, **kwargs):
+            urls.append(url)
+            clients.append(kwargs.get("client"))
+            if dest_path.name == failing:
+                raise RuntimeError("network down")
+            dest_path.write_text("downloaded", encoding="utf-8")
+            return True
+
+        with patch("cc_spec.commands.update.download_file", side_effect=fake_download):
+            result = runner.invoke(app, ["update", "--templates"])
+
+        assert result.exit_code == 0
+        assert len(urls) == len(TEMPLATE_FILES)
+        assert all("/main/templates/" in url for url in urls)
+        # 全部下载共享同一个 HTTP 客户端（复用连接）
+        assert clients[0] is not None
+        assert all(c is clients[0] for c in clients)
+        templates_dir = cc_spec_dir / "templates"
+        # 下载失败的模板回退到内置版本，其余模板不受影响
+        assert (templates_dir / failing).read_text(encoding="utf-8") != "downloaded"
+        for name in TEMPLATE_FILES[1:]:
+            assert (templates_dir / name).read_text(encoding="utf-8") == "downloaded"
+
 
 class TestUpdateSubagentConfig:
     def test_update_subagent_adds_profiles(self, tmp_path, monkeypatch) -> None:
@@ -83,3 +180,58 @@ class TestUpdateSubagentConfig:
         assert "subagent" in updated
         assert "common" in updated["subagent"]
         assert "profiles" in updated["subagent"]
+
+    def test_update_subagent_up_to_date_reports_nothing(self, tmp_path, monkeypatch) -> None:
+        monkeypatch.chdir(tmp_path)
+
+        cc_spec_dir = get_cc_spec_dir(tmp_path)
+        cc_spec_dir.mkdir(parents=True)
+        write_yaml(cc_spec_dir / "config.yaml", {"version": "1.0", "agent": "claude"})
+
+        first = runner.invoke(app, ["update", "subagent"])
+        assert first.exit_code == 0
+        assert "更新完成" in first.stdout
+
+        second = runner.invoke(app, ["update", "subagent"])
+        assert second.exit_code == 0
+        assert "Nothing to update" in second.stdout
+
+    def test_update_unknown_target_runs_nothing(self, tmp_path, monkeypatch) -> None:
+        monkeypatch.chdir(tmp_path)
+
+        cc_spec_dir = get_cc_spec_dir(tmp_path)
+        cc_spec_dir.mkdir(parents=True)
+        write_yaml(cc_spec_dir / "config.yaml", {"version": "1.0", "agent": "claude"})
+
+        result = runner.invoke(app, ["update", "bogus"])
+
+        assert result.exit_code == 0
+        assert "Nothing to update" in result.stdout
+        assert "subagent" not in (read_yaml(cc_spec_dir / "config.yaml") or {})
+
+    def test_update_subagent_reuses_loaded_raw_data(self, tmp_path) -> None:
+        cc_spec_dir = get_cc_spec_dir(tmp_path)
+        cc_spec_dir.mkdir(parents=True)
+        config_path = cc_spec_dir / "config.yaml"
+        write_yaml(
+            config_path,
+            {
+                "version": "1.0",
+                "custom": {"keep": True},
+                "subagent": {"common": {"model": "sonnet"}},
+            },
+        )
+
+        config = update_module.load_config(config_path)
+        raw_before = copy.deepcopy(config.raw_data)
+        with patch.object(Path, "read_bytes", side_effect=AssertionError("re-read")):
+            changed = update_module._update_subagent_config(
+                tmp_path, cc_spec_dir, config, False
+            )
+
+        assert changed is True
+        assert config.raw_data == raw_before
+        updated = read_yaml(config_path) or {}
+        assert updated["custom"] == {"keep": True}
+        assert "profiles" in updated["subagent"]
+        assert not list(cc_spec_dir.glob("*.tmp"))
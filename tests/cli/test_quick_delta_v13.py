@@ -1,5 +1,7 @@
 """quick-delta 增强测试。"""
 
+import subprocess
+
 import pytest
 from pathlib import Path
 from unittest.mock import patch, MagicMock
@@ -11,13 +13,28 @@ from cc_spec.commands.quick_delta import (
     DiffStats,
     _count_changed_files,
     _parse_git_diff,
-    _parse_name_status,
-    _get_diff_stats,
+    _parse_diff_output,
     _generate_slug,
+    _format_preview,
+    _summarize_changes,
+    _get_git_info,
+    _clear_git_caches,
+    _diff_shortstat,
+    _count_untracked_files,
+    _is_git_repo,
+    _run_git,
 )
 from cc_spec.rag.incremental import GitChangeSet
 
 
+@pytest.fixture(autouse=True)
+def _reset_git_caches():
+    """每个用例前后清空 git 查询缓存，避免 mock 结果串用。"""
+    _clear_git_caches()
+    yield
+    _clear_git_caches()
+
+
 class TestFileChange:
     """测试 FileChange 数据类。"""
 
@@ -127,14 +144,60 @@ class TestDiffStats:
 
         assert stats.count_by_operation(DeltaOperation.REMOVED) == 0
 
+    def test_count_operations_single_pass(self):
+        """测试一次遍历统计全部操作类型。"""
+        changes = [
+            FileChange("a.py", DeltaOperation.ADDED),
+            FileChange("b.py", DeltaOperation.ADDED),
+            FileChange("c.py", DeltaOperation.RENAMED, old_path="d.py"),
+        ]
+        counts = DiffStats(changes=changes).count_operations()
+
+        assert counts[DeltaOperation.ADDED] == 2
+        assert counts[DeltaOperation.RENAMED] == 1
+        assert counts[DeltaOperation.REMOVED] == 0
+
+    def test_summarize_changes_single_pass(self):
+        """测试变更摘要一次生成行、统计与总行数，预览与 mini-proposal 共用。"""
+        stats = DiffStats(
+            changes=[
+                FileChange("a.py", DeltaOperation.ADDED, additions=3),
+                FileChange("c.py", DeltaOperation.RENAMED, old_path="b.py"),
+            ],
+            total_additions=3,
+        )
+        summary = _summarize_changes(stats)
 
-class TestParseNameStatus:
-    """测试 _parse_name_status 函数。"""
+        assert summary.rows == (
+            (DeltaOperation.ADDED, "a.py", "+3 -0"),
+            (DeltaOperation.RENAMED, "b.py → c.py", "-"),
+        )
+        assert summary.counts_markup() == "[green]+1[/green] [blue]→1[/blue]"
+
+        with patch.object(DiffStats, "count_operations") as mock_count:
+            preview = _format_preview("msg", None, summary)
+
+        mock_count.assert_not_called()
+        assert "（+3 -0 行）" in preview
+
+
+def _raw(status: str, *paths: str) -> str:
+    """构造一条 ``git diff --raw -z`` 记录。"""
+    return "\0".join([f":100644 100644 abc1234 def5678 {status}", *paths]) + "\0"
+
+
+def _numstat(additions: str, deletions: str, path: str, *rename: str) -> str:
+    """构造一条 ``git diff --numstat -z`` 记录（重命名时 path 为空）。"""
+    return "\0".join([f"{additions}\t{deletions}\t{path}", *rename]) + "\0"
+
+
+class TestParseDiffOutput:
+    """测试 _parse_diff_output 函数。"""
 
     def test_parse_added_file(self):
         """测试解析新增文件。"""
-        output = "A\tsrc/new_file.py\n"
-        result = _parse_name_status(output)
+        output = _raw("A", "src/new_file.py")
+        result = _parse_diff_output(output)
 
         assert len(result) == 1
         assert result[0].path == "src/new_file.py"
@@ -142,8 +205,8 @@ class TestParseNameStatus:
 
     def test_parse_modified_file(self):
         """测试解析修改的文件。"""
-        output = "M\tsrc/existing.py\n"
-        result = _parse_name_status(output)
+        output = _raw("M", "src/existing.py")
+        result = _parse_diff_output(output)
 
         assert len(result) == 1
         assert result[0].path == "src/existing.py"
@@ -151,8 +214,8 @@ class TestParseNameStatus:
 
     def test_parse_deleted_file(self):
         """测试解析删除的文件。"""
-        output = "D\tsrc/deleted.py\n"
-        result = _parse_name_status(output)
+        output = _raw("D", "src/deleted.py")
+        result = _parse_diff_output(output)
 
         assert len(result) == 1
         assert result[0].path == "src/deleted.py"
@@ -160,18 +223,21 @@ class TestParseNameStatus:
 
     def test_parse_renamed_file(self):
         """测试解析重命名的文件。"""
-        output = "R100\told_name.py\tnew_name.py\n"
-        result = _parse_name_status(output)
+        output = _raw("R100", "old_name.py", "new_name.py") + _numstat(
+            "3", "1", "", "old_name.py", "new_name.py"
+        )
+        result = _parse_diff_output(output)
 
         assert len(result) == 1
         assert result[0].path == "new_name.py"
         assert result[0].old_path == "old_name.py"
         assert result[0].operation == DeltaOperation.RENAMED
+        assert (result[0].additions, result[0].deletions) == (3, 1)
 
     def test_parse_multiple_files(self):
         """测试解析多个文件。"""
-        output = "A\tnew.py\nM\texisting.py\nD\tdeleted.py\n"
-        result = _parse_name_status(output)
+        output = _raw("A", "new.py") + _raw("M", "existing.py") + _raw("D", "deleted.py")
+        result = _parse_diff_output(output)
 
         assert len(result) == 3
         assert result[0].operation == DeltaOperation.ADDED
@@ -180,87 +246,46 @@ class TestParseNameStatus:
 
     def test_parse_empty_output(self):
         """测试解析空输出。"""
-        result = _parse_name_status("")
+        result = _parse_diff_output("")
 
         assert len(result) == 0
 
     def test_parse_unknown_status(self):
         """测试解析未知状态。"""
-        output = "U\tunmerged.py\n"  # U = 未合并
-        result = _parse_name_status(output)
+        output = _raw("U", "unmerged.py")  # U = 未合并
+        result = _parse_diff_output(output)
 
         assert len(result) == 1
         # 未知状态默认为 MODIFIED
         assert result[0].operation == DeltaOperation.MODIFIED
 
-    def test_parse_with_spaces_in_path(self):
-        """测试路径包含空格（tab 分隔）。"""
-        output = "M\tsrc/path with spaces/file.py\n"
-        result = _parse_name_status(output)
+    def test_parse_with_special_chars_in_path(self):
+        """测试路径包含空格、制表符与中文（-z 模式不转义）。"""
+        output = _raw("M", "src/path with spaces/文件\t.py")
+        result = _parse_diff_output(output)
 
         assert len(result) == 1
-        assert result[0].path == "src/path with spaces/file.py"
-
-
-class TestGetDiffStats:
-    """测试 _get_diff_stats 函数。"""
-
-    @patch("cc_spec.commands.quick_delta.subprocess.run")
-    def test_get_stats_success(self, mock_run):
-        """测试成功获取统计信息。"""
-        mock_run.return_value = CompletedProcess(
-            args=["git", "diff"],
-            returncode=0,
-            stdout="10\t5\tsrc/main.py\n20\t3\tsrc/utils.py\n",
+        assert result[0].path == "src/path with spaces/文件\t.py"
+
+    def test_merge_numstat(self):
+        """测试合并行数统计。"""
+        output = (
+            _raw("M", "src/main.py")
+            + _raw("M", "src/utils.py")
+            + _numstat("10", "5", "src/main.py")
+            + _numstat("20", "3", "src/utils.py")
         )
+        result = _parse_diff_output(output)
 
-        result = _get_diff_stats("--staged")
-
-        assert "src/main.py" in result
-        assert result["src/main.py"] == (10, 5)
-        assert "src/utils.py" in result
-        assert result["src/utils.py"] == (20, 3)
+        assert (result[0].additions, result[0].deletions) == (10, 5)
+        assert (result[1].additions, result[1].deletions) == (20, 3)
 
-    @patch("cc_spec.commands.quick_delta.subprocess.run")
-    def test_get_stats_binary_file(self, mock_run):
+    def test_binary_file_stats(self):
         """测试二进制文件统计。"""
-        mock_run.return_value = CompletedProcess(
-            args=["git", "diff"],
-            returncode=0,
-            stdout="-\t-\timage.png\n10\t5\tsrc/main.py\n",
-        )
-
-        result = _get_diff_stats("--staged")
-
-        assert "image.png" in result
-        assert result["image.png"] == (0, 0)  # 二进制文件
-        assert result["src/main.py"] == (10, 5)
-
-    @patch("cc_spec.commands.quick_delta.subprocess.run")
-    def test_get_stats_empty(self, mock_run):
-        """测试空输出。"""
-        mock_run.return_value = CompletedProcess(
-            args=["git", "diff"],
-            returncode=0,
-            stdout="",
-        )
-
-        result = _get_diff_stats("--staged")
-
-        assert len(result) == 0
-
-    @patch("cc_spec.commands.quick_delta.subprocess.run")
-    def test_get_stats_error(self, mock_run):
-        """测试命令失败。"""
-        mock_run.return_value = CompletedProcess(
-            args=["git", "diff"],
-            returncode=1,
-            stdout="",
-        )
-
-        result = _get_diff_stats("--staged")
+        output = _raw("M", "image.png") + _numstat("-", "-", "image.png")
+        result = _parse_diff_output(output)
 
-        assert len(result) == 0
+        assert (result[0].additions, result[0].deletions) == (0, 0)
 
 
 class TestParseGitDiff:
@@ -268,24 +293,21 @@ class TestParseGitDiff:
 
     @patch("cc_spec.commands.quick_delta.subprocess.run")
     def test_parse_staged_changes(self, mock_run):
-        """测试解析 staged 变更。"""
-        # 第一次调用 (name-status) 返回变更
-        # 第二次调用 (numstat) 返回统计
-        mock_run.side_effect = [
-            CompletedProcess(
-                args=["git", "diff", "--staged", "--name-status"],
-                returncode=0,
-                stdout="A\tnew.py\nM\texisting.py\n",
-            ),
-            CompletedProcess(
-                args=["git", "diff", "--staged", "--numstat"],
-                returncode=0,
-                stdout="10\t0\tnew.py\n5\t3\texisting.py\n",
+        """测试解析 staged 变更（单次 git 调用）。"""
+        mock_run.return_value = CompletedProcess(
+            args=["git", "diff", "--staged", "--raw", "--numstat", "-z"],
+            returncode=0,
+            stdout=(
+                _raw("A", "new.py")
+                + _raw("M", "existing.py")
+                + _numstat("10", "0", "new.py")
+                + _numstat("5", "3", "existing.py")
             ),
-        ]
+        )
 
-        result = _parse_git_diff()
+        result = _parse_git_diff(Path("/repo"))
 
+        assert mock_run.call_count == 1
         assert result is not None
         assert len(result.changes) == 2
         assert result.total_additions == 15
@@ -297,29 +319,24 @@ class TestParseGitDiff:
         mock_run.side_effect = [
             # staged 为空
             CompletedProcess(
-                args=["git", "diff", "--staged", "--name-status"],
+                args=["git", "diff", "--staged", "--raw", "--numstat", "-z"],
                 returncode=0,
                 stdout="",
             ),
             # HEAD~1 有变更
             CompletedProcess(
-                args=["git", "diff", "HEAD~1", "--name-status"],
+                args=["git", "diff", "HEAD~1", "--raw", "--numstat", "-z"],
                 returncode=0,
-                stdout="M\tmodified.py\n",
-            ),
-            # numstat
-            CompletedProcess(
-                args=["git", "diff", "HEAD~1", "--numstat"],
-                returncode=0,
-                stdout="5\t2\tmodified.py\n",
+                stdout=_raw("M", "modified.py") + _numstat("5", "2", "modified.py"),
             ),
         ]
 
-        result = _parse_git_diff()
+        result = _parse_git_diff(Path("/repo"))
 
         assert result is not None
         assert len(result.changes) == 1
         assert result.changes[0].operation == DeltaOperation.MODIFIED
+        assert result.total_additions == 5
 
     @patch("cc_spec.commands.quick_delta.subprocess.run")
     def test_parse_no_changes(self, mock_run):
@@ -327,19 +344,19 @@ class TestParseGitDiff:
         mock_run.side_effect = [
             # staged 为空
             CompletedProcess(
-                args=["git", "diff", "--staged", "--name-status"],
+                args=["git", "diff", "--staged", "--raw", "--numstat", "-z"],
                 returncode=0,
                 stdout="",
             ),
             # HEAD~1 也为空
             CompletedProcess(
-                args=["git", "diff", "HEAD~1", "--name-status"],
+                args=["git", "diff", "HEAD~1", "--raw", "--numstat", "-z"],
                 returncode=0,
                 stdout="",
             ),
         ]
 
-        result = _parse_git_diff()
+        result = _parse_git_diff(Path("/repo"))
 
         assert result is None
 
@@ -349,22 +366,45 @@ class TestParseGitDiff:
         mock_run.side_effect = [
             # staged 失败
             CompletedProcess(
-                args=["git", "diff", "--staged", "--name-status"],
+                args=["git", "diff", "--staged", "--raw", "--numstat", "-z"],
                 returncode=1,
                 stdout="",
             ),
             # HEAD~1 也失败
             CompletedProcess(
-                args=["git", "diff", "HEAD~1", "--name-status"],
+                args=["git", "diff", "HEAD~1", "--raw", "--numstat", "-z"],
                 returncode=1,
                 stdout="",
             ),
         ]
 
-        result = _parse_git_diff()
+        result = _parse_git_diff(Path("/repo"))
 
         assert result is None
 
+    @patch("cc_spec.commands.quick_delta.subprocess.run")
+    def test_repeated_calls_return_fresh_objects(self, mock_run):
+        """测试重复调用只执行一次 git，但每次返回独立的 DiffStats。"""
+        mock_run.return_value = CompletedProcess(
+            args=["git", "diff", "--staged", "--raw", "--numstat", "-z"],
+            returncode=0,
+            stdout=_raw("M", "a.py") + _numstat("4", "1", "a.py"),
+        )
+
+        first = _parse_git_diff(Path("/repo"))
+        assert first is not None
+        first.changes[0].additions = 100
+        first.changes.clear()
+
+        second = _parse_git_diff(Path("/repo"))
+
+        assert mock_run.call_count == 1
+        assert second is not None
+        assert second is not first
+        assert len(second.changes) == 1
+        assert second.changes[0].additions == 4
+        assert second.total_additions == 4
+
 
 class TestGenerateSlug:
     """测试 _generate_slug 函数。"""
@@ -420,6 +460,225 @@ class TestGenerateSlug:
         assert not slug.startswith("-")
         assert not slug.endswith("-")
 
+    def test_ascii_fast_path_matches_regex_path(self):
+        """测试纯 ASCII 快速路径与正则路径结果一致。"""
+        from cc_spec.commands.quick_delta import _SLUG_SEPARATOR_RE, _SLUG_STRIP_RE
+
+        for message in ["Fix_snake CASE -- now!", " -lead\ttab", "a" * 29 + " b", "x.y-z "]:
+            expected = _SLUG_SEPARATOR_RE.sub("-", _SLUG_STRIP_RE.sub("", message.lower()))
+            expected = expected[:30].strip("-") or "change"
+            assert _generate_slug(message) == expected
+
+
+class TestGetGitInfo:
+    """测试 _get_git_info 函数。"""
+
+    @patch("cc_spec.commands.quick_delta.subprocess.run")
+    def test_single_git_call(self, mock_run):
+        """应通过一次 git log 获取全部字段。"""
+        mock_run.return_value = CompletedProcess(
+            args=["git", "log"],
+            returncode=0,
+            stdout="abc123\x1fTest User <test@example.com>\x1fInitial commit\n",
+        )
+
+        result = _get_git_info(Path("/repo"))
+
+        assert mock_run.call_count == 1
+        assert result == {
+            "hash": "abc123",
+            "author": "Test User <test@example.com>",
+            "message": "Initial commit",
+        }
+
+    @patch("cc_spec.commands.quick_delta.subprocess.run")
+    def test_result_is_cached(self, mock_run):
+        """同一 project_root 重复调用只执行一次 git。"""
+        mock_run.return_value = CompletedProcess(
+            args=["git", "log"],
+            returncode=0,
+            stdout="abc123\x1fTest User <test@example.com>\x1fInitial commit\n",
+        )
+
+        first = _get_git_info(Path("/repo"))
+        second = _get_git_info(Path("/repo"))
+
+        assert first is second
+        assert mock_run.call_count == 1
+
+    @patch("cc_spec.commands.quick_delta.subprocess.run")
+    def test_not_a_repo(self, mock_run):
+        """git 失败时返回 None。"""
+        mock_run.return_value = CompletedProcess(
+            args=["git", "log"],
+            returncode=128,
+            stdout="",
+        )
+
+        assert _get_git_info(Path("/repo")) is None
+
+    @patch("cc_spec.commands.quick_delta.subprocess.run", side_effect=FileNotFoundError)
+    def test_git_missing(self, mock_run):
+        """未安装 git 时返回 None。"""
+        assert _get_git_info(Path("/repo")) is None
+
+
+class TestRunGit:
+    """测试 _run_git 函数。"""
+
+    @patch("cc_spec.commands.quick_delta.subprocess.run")
+    def test_passes_env_and_timeout(self, mock_run):
+        """git 调用带上关闭可选锁的环境与超时。"""
+        mock_run.return_value = CompletedProcess(args=["git"], returncode=0, stdout="")
+
+        _run_git(["status"], Path("/repo"))
+
+        kwargs = mock_run.call_args.kwargs
+        assert mock_run.call_args.args[0] == ["git", "status"]
+        assert kwargs["env"]["GIT_OPTIONAL_LOCKS"] == "0"
+        assert kwargs["timeout"] > 0
+
+    @patch("cc_spec.commands.quick_delta.subprocess.run")
+    def test_env_reflects_runtime_changes(self, mock_run, monkeypatch):
+        """环境变量在每次调用时读取，运行期修改（如 PATH、GIT_DIR）生效。"""
+        mock_run.return_value = CompletedProcess(args=["git"], returncode=0, stdout="")
+        monkeypatch.setenv("GIT_DIR", "/elsewhere/.git")
+
+        _run_git(["status"], Path("/repo"))
+
+        env = mock_run.call_args.kwargs["env"]
+        assert env["GIT_DIR"] == "/elsewhere/.git"
+        assert env["LC_ALL"] == "C"
+
+    @patch(
+        "cc_spec.commands.quick_delta.subprocess.run",
+        side_effect=subprocess.TimeoutExpired(cmd="git", timeout=5),
+    )
+    def test_timeout_returns_none(self, mock_run):
+        """git 超时视为不可用。"""
+        assert _run_git(["log"], Path("/repo")) is None
+        assert _get_git_info(Path("/repo")) is None
+
+
+class TestDiffShortstat:
+    """测试 _diff_shortstat 函数。"""
+
+    @patch("cc_spec.commands.quick_delta.subprocess.run")
+    def test_parse_full_summary(self, mock_run):
+        """解析文件数、新增与删除行数。"""
+        mock_run.return_value = CompletedProcess(
+            args=["git", "diff"],
+            returncode=0,
+            stdout=" 12 files changed, 340 insertions(+), 7 deletions(-)\n",
+        )
+
+        assert _diff_shortstat(Path("/repo")) == (12, 340, 7)
+
+    @patch("cc_spec.commands.quick_delta.subprocess.run")
+    def test_parse_partial_summary(self, mock_run):
+        """仅有删除行时新增计为 0。"""
+        mock_run.return_value = CompletedProcess(
+            args=["git", "diff"],
+            returncode=0,
+            stdout=" 1 file changed, 2 deletions(-)\n",
+        )
+
+        assert _diff_shortstat(Path("/repo")) == (1, 0, 2)
+
+    @patch("cc_spec.commands.quick_delta.subprocess.run")
+    def test_no_changes(self, mock_run):
+        """无变更时返回全 0。"""
+        mock_run.return_value = CompletedProcess(
+            args=["git", "diff"],
+            returncode=0,
+            stdout="",
+        )
+
+        assert _diff_shortstat(Path("/repo")) == (0, 0, 0)
+
+    @patch("cc_spec.commands.quick_delta.subprocess.run")
+    def test_git_error(self, mock_run):
+        """git 失败时返回 None。"""
+        mock_run.return_value = CompletedProcess(
+            args=["git", "diff"],
+            returncode=128,
+            stdout="",
+        )
+
+        assert _diff_shortstat(Path("/repo")) is None
+
+
+class TestWorktreeScope:
+    """测试快速统计覆盖整个仓库，并排除 .cc-spec/。"""
+
+    @staticmethod
+    def _git(cwd: Path, *args: str) -> None:
+        subprocess.run(
+            ["git", "-c", "user.email=t@t", "-c", "user.name=t", *args],
+            cwd=cwd, check=True, capture_output=True,
+        )
+
+    def test_project_in_subdirectory_counts_whole_repo(self, tmp_path):
+        """项目位于仓库子目录时，统计口径仍为整个仓库（与 _parse_git_diff 一致）。"""
+        project = tmp_path / "sub"
+        for rel in ("other/x", "sub/y", "sub/.cc-spec/z", ".cc-spec/w"):
+            (tmp_path / rel).parent.mkdir(parents=True, exist_ok=True)
+            (tmp_path / rel).write_text("a\n", encoding="utf-8")
+        self._git(tmp_path, "init", "-q")
+        self._git(tmp_path, "add", "-A")
+        self._git(tmp_path, "commit", "-q", "-m", "init")
+        for rel in ("other/x", "sub/y", "sub/.cc-spec/z", ".cc-spec/w"):
+            (tmp_path / rel).write_text("b\n", encoding="utf-8")
+        for rel in ("other/u", "sub/u", "sub/.cc-spec/u", ".cc-spec/u"):
+            (tmp_path / rel).write_text("u\n", encoding="utf-8")
+
+        assert _diff_shortstat(project) == (2, 2, 2)
+        assert _count_untracked_files(project) == 2
+
+
+class TestIsGitRepo:
+    """测试 _is_git_repo 函数。"""
+
+    @patch("cc_spec.commands.quick_delta.subprocess.run")
+    def test_inside_work_tree_is_cached(self, mock_run):
+        """仓库内返回 True，且同一目录只探测一次。"""
+        mock_run.return_value = CompletedProcess(
+            args=["git", "rev-parse"], returncode=0, stdout="true\n"
+        )
+
+        assert _is_git_repo(Path("/repo")) is True
+        assert _is_git_repo(Path("/repo")) is True
+        assert mock_run.call_count == 1
+
+    @patch("cc_spec.commands.quick_delta.subprocess.run")
+    def test_not_a_repo(self, mock_run):
+        """非仓库目录返回 False。"""
+        mock_run.return_value = CompletedProcess(
+            args=["git", "rev-parse"], returncode=128, stdout=""
+        )
+
+        assert _is_git_repo(Path("/repo")) is False
+
+
+class TestCountUntrackedFiles:
+    """测试 _count_untracked_files 函数。"""
+
+    @patch("cc_spec.commands.quick_delta.subprocess.run")
+    def test_count_nul_terminated_paths(self, mock_run):
+        """按 NUL 分隔统计文件数（路径可含空格）。"""
+        mock_run.return_value = CompletedProcess(
+            args=["git", "ls-files"],
+            returncode=0,
+            stdout="new file.py\0docs/a.md\0",
+        )
+
+        assert _count_untracked_files(Path("/repo")) == 2
+
+    @patch("cc_spec.commands.quick_delta.subprocess.run", side_effect=FileNotFoundError)
+    def test_git_missing(self, mock_run):
+        """未安装 git 时计为 0。"""
+        assert _count_untracked_files(Path("/repo")) == 0
+
 
 class TestCountChangedFiles:
     """测试 _count_changed_files 函数。"""
@@ -454,22 +713,22 @@ class TestIntegration:
     @patch("cc_spec.commands.quick_delta.subprocess.run")
     def test_full_diff_parse_workflow(self, mock_run):
         """测试完整的 diff 解析流程。"""
-        mock_run.side_effect = [
-            # name-status
-            CompletedProcess(
-                args=["git", "diff", "--staged", "--name-status"],
-                returncode=0,
-                stdout="A\tsrc/new.py\nM\tsrc/existing.py\nD\tsrc/deleted.py\nR100\tsrc/old.py\tsrc/renamed.py\n",
-            ),
-            # numstat
-            CompletedProcess(
-                args=["git", "diff", "--staged", "--numstat"],
-                returncode=0,
-                stdout="50\t0\tsrc/new.py\n10\t5\tsrc/existing.py\n0\t30\tsrc/deleted.py\n20\t20\tsrc/renamed.py\n",
+        mock_run.return_value = CompletedProcess(
+            args=["git", "diff", "--staged", "--raw", "--numstat", "-z"],
+            returncode=0,
+            stdout=(
+                _raw("A", "src/new.py")
+                + _raw("M", "src/existing.py")
+                + _raw("D", "src/deleted.py")
+                + _raw("R100", "src/old.py", "src/renamed.py")
+                + _numstat("50", "0", "src/new.py")
+                + _numstat("10", "5", "src/existing.py")
+                + _numstat("0", "30", "src/deleted.py")
+                + _numstat("20", "20", "", "src/old.py", "src/renamed.py")
             ),
-        ]
+        )
 
-        result = _parse_git_diff()
+        result = _parse_git_diff(Path("/repo"))
 
         assert result is not None
         assert len(result.changes) == 4
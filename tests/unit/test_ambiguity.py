@@ -1,5 +1,10 @@
 """Tests for ambiguity module."""
 
+import json
+from dataclasses import FrozenInstanceError
+
+import pytest
+
 from cc_spec.core.ambiguity import (
     AMBIGUITY_KEYWORDS,
     AmbiguityMatch,
@@ -8,6 +13,7 @@ from cc_spec.core.ambiguity import (
     filter_false_positives,
     get_context,
     is_in_code_block,
+    matches_to_json,
 )
 from cc_spec.core.ambiguity.detector import (
     get_all_keywords,
@@ -187,6 +193,31 @@ class TestAmbiguityMatch:
         assert "权限" in result
         assert "需要检查权限" in result
 
+    def test_uses_slots(self) -> None:
+        """Test AmbiguityMatch instances have no per-instance __dict__."""
+        match = AmbiguityMatch(
+            type=AmbiguityType.SCOPE,
+            keyword="maybe",
+            line_number=1,
+            context="maybe",
+        )
+        assert not hasattr(match, "__dict__")
+        # frozen+slots dataclasses raise TypeError for unknown attributes on 3.11
+        with pytest.raises((AttributeError, TypeError)):
+            match.extra = 1  # type: ignore[attr-defined]
+
+    def test_is_frozen_and_hashable(self) -> None:
+        """Test AmbiguityMatch is immutable and usable as a dict/set key."""
+        match = AmbiguityMatch(
+            type=AmbiguityType.SCOPE,
+            keyword="maybe",
+            line_number=1,
+            context="maybe",
+        )
+        with pytest.raises(FrozenInstanceError):
+            match.confidence = 0.5  # type: ignore[misc]
+        assert match in {match}
+
     def test_to_dict(self) -> None:
         """Test to_dict conversion."""
         match = AmbiguityMatch(
@@ -205,6 +236,15 @@ class TestAmbiguityMatch:
         assert result["original_line"] == "check the version"
         assert result["confidence"] == 0.9
 
+    def test_matches_to_json(self) -> None:
+        """Test batch JSON serialization matches per-item to_dict."""
+        matches = detect("可能需要支持更多格式\n这个功能很快")
+        assert matches
+        payload = json.loads(matches_to_json(matches))
+        assert payload == [m.to_dict() for m in matches]
+        assert "可能" in matches_to_json(matches)
+        assert matches_to_json([]) == "[]"
+
 
 class TestHelperFunctions:
     """Tests for helper functions."""
@@ -540,3 +580,82 @@ maybe lowercase.
         matches = detect(content)
         maybe_matches = [m for m in matches if m.keyword.lower() == "maybe"]
         assert len(maybe_matches) >= 3
+
+    def test_detect_reports_overlapping_keywords(self) -> None:
+        """Test keywords nested in longer ones are still reported per type."""
+        content = "The request may fail with a failure in response time.\n"
+
+        found = {(m.type, m.keyword) for m in detect(content)}
+
+        assert (AmbiguityType.ERROR_HANDLING, "fail") in found
+        assert (AmbiguityType.ERROR_HANDLING, "failure") in found
+        assert (AmbiguityType.INTERFACE, "response") in found
+        assert (AmbiguityType.PERFORMANCE, "response time") in found
+
+    def test_keyword_automaton_matches_substring_scan(self) -> None:
+        """Test the keyword automaton finds exactly the keywords a substring scan finds."""
+        from cc_spec.core.ambiguity.detector import _KEYWORD_ENTRIES, _find_keyword_entries
+
+        lines = [
+            "the request may fail with a failure in response time",
+            "可能需要支持更多格式，接口返回值待定",
+            "nothing relevant here",
+            "",
+            " ".join(keyword for _, keyword, _ in _KEYWORD_ENTRIES).lower(),
+        ]
+        for line in lines:
+            expected = [
+                idx
+                for idx, (_, _, keyword_lower) in enumerate(_KEYWORD_ENTRIES)
+                if keyword_lower in line
+            ]
+            assert _find_keyword_entries(line) == expected
+
+    def test_keyword_prefilter_matches_each_keyword(self) -> None:
+        """Test the prefix-tree prefilter accepts every keyword and only keyword lines."""
+        from cc_spec.core.ambiguity.detector import _KEYWORD_ENTRIES, _KEYWORD_UNION_RE
+
+        for _, _, keyword_lower in _KEYWORD_ENTRIES:
+            assert _KEYWORD_UNION_RE.search(f"x {keyword_lower} y")
+            assert _KEYWORD_UNION_RE.fullmatch(keyword_lower)
+        assert not _KEYWORD_UNION_RE.search("nothing relevant here")
+
+    def test_code_block_mask_matches_is_in_code_block(self) -> None:
+        """Test the single-pass code block mask agrees with is_in_code_block."""
+        from cc_spec.core.ambiguity.detector import _code_block_mask
+
+        lines = [
+            "intro maybe",
+            "```python",
+            "maybe = 1",
+            "  ```",
+            "after maybe",
+            "```",
+            "unterminated maybe",
+        ]
+        assert _code_block_mask(lines) == [
+            is_in_code_block(lines, idx) for idx in range(len(lines))
+        ]
+
+    def test_detect_dedup_drops_nested_same_type_keywords(self) -> None:
+        """Test dedup drops keywords fully covered by a longer same-type keyword."""
+        content = "A failure occurred and the response time is slow.\n"
+
+        default = {(m.type, m.keyword) for m in detect(content)}
+        deduped = {(m.type, m.keyword) for m in detect(content, dedup=True)}
+
+        assert (AmbiguityType.ERROR_HANDLING, "fail") in default
+        assert (AmbiguityType.ERROR_HANDLING, "fail") not in deduped
+        assert (AmbiguityType.ERROR_HANDLING, "failure") in deduped
+        # Overlapping keywords of different types are each kept
+        assert (AmbiguityType.INTERFACE, "response") in deduped
+        assert (AmbiguityType.PERFORMANCE, "response time") in deduped
+
+    def test_detect_dedup_keeps_standalone_occurrence(self) -> None:
+        """Test dedup keeps a short keyword that also appears on its own."""
+        content = "It may fail, and the failure is logged.\n"
+
+        deduped = {(m.type, m.keyword) for m in detect(content, dedup=True)}
+
+        assert (AmbiguityType.ERROR_HANDLING, "fail") in deduped
+        assert (AmbiguityType.ERROR_HANDLING, "failure") in deduped
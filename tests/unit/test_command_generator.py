@@ -1,14 +1,21 @@
 """Tests for command_generator module (v0.1.6)."""
 
+import os
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from unittest.mock import patch
 
 from cc_spec.core.command_generator import (
     CC_SPEC_COMMANDS,
     COMMAND_GENERATORS,
+    COMMAND_TEMPLATES,
     MANAGED_END,
     MANAGED_START,
+    _TEMPLATE_INSTANCES,
     ClaudeCommandGenerator,
+    _render_template,
+    clear_template_cache,
     get_available_agents,
     get_generator,
 )
@@ -91,6 +98,124 @@ class TestClaudeCommandGenerator:
             for cmd_name, _ in CC_SPEC_COMMANDS:
                 assert (cmd_dir / f"{cmd_name}.md").exists()
 
+    def test_generate_all_matches_sequential_generation(self) -> None:
+        generator = ClaudeCommandGenerator()
+        with tempfile.TemporaryDirectory() as tmpdir:
+            project_root = Path(tmpdir)
+            paths = generator.generate_all(project_root)
+
+            # 并发写入后结果仍按命令顺序返回，内容与逐个生成一致
+            assert [p.stem for p in paths] == [name for name, _ in CC_SPEC_COMMANDS]
+            contents = [p.read_text(encoding="utf-8") for p in paths]
+            for (cmd_name, description), content in zip(CC_SPEC_COMMANDS, contents):
+                path = generator.generate_command(cmd_name, description, project_root)
+                assert path.read_text(encoding="utf-8") == content
+
+    def test_template_render_is_cached(self) -> None:
+        generator = ClaudeCommandGenerator()
+        clear_template_cache()
+        with tempfile.TemporaryDirectory() as tmpdir:
+            project_root = Path(tmpdir)
+            first = generator.generate_command("specify", "Desc", project_root)
+            content = first.read_text(encoding="utf-8")
+            generator.update_command("specify", "Desc", project_root)
+
+            # 同一命令第二次生成命中缓存，内容与首次一致
+            info = _render_template.cache_info()
+            assert (info.misses, info.hits) == (1, 1)
+            assert first.read_text(encoding="utf-8") == content
+
+        clear_template_cache()
+        assert _render_template.cache_info().currsize == 0
+
+    def test_concurrent_updates_use_their_own_project_root(self) -> None:
+        generator = ClaudeCommandGenerator()
+
+        def fake_render(template_cls, cmd_name, namespace, project_root):
+            return f"rendered for {project_root}"
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            # 每个线程一个独立项目，各自只写自己的 plan.md，只验证渲染参数不串扰
+            roots = [Path(tmpdir) / f"project-{i}" for i in range(16)]
+            with patch(
+                "cc_spec.core.command_generator._render_template", side_effect=fake_render
+            ):
+                # 同一生成器在多个线程中更新不同项目
+                with ThreadPoolExecutor(max_workers=8) as executor:
+                    paths = list(
+                        executor.map(
+                            lambda root: generator.update_command("plan", "Desc", root),
+                            roots,
+                        )
+                    )
+
+            for root, path in zip(roots, paths):
+                assert f"rendered for {root}" in path.read_text(encoding="utf-8")
+
+    def test_template_instances_are_reused(self) -> None:
+        generator = ClaudeCommandGenerator()
+        clear_template_cache()
+        with tempfile.TemporaryDirectory() as tmpdir:
+            generator.generate_command("plan", "Desc", Path(tmpdir))
+            template = _TEMPLATE_INSTANCES[COMMAND_TEMPLATES["plan"]]
+
+        # 渲染缓存清空后重新渲染，仍复用同一个模板实例
+        clear_template_cache()
+        with tempfile.TemporaryDirectory() as tmpdir:
+            generator.generate_command("plan", "Desc", Path(tmpdir))
+        assert _TEMPLATE_INSTANCES[COMMAND_TEMPLATES["plan"]] is template
+
+    def test_regenerating_identical_content_skips_write(self) -> None:
+        generator = ClaudeCommandGenerator()
+        with tempfile.TemporaryDirectory() as tmpdir:
+            project_root = Path(tmpdir)
+            path = generator.generate_command("specify", "Same desc", project_root)
+            assert path is not None
+            os.utime(path, ns=(1_000_000_000, 1_000_000_000))
+
+            # 内容一致：generate/update 均不重写文件，mtime 不变
+            generator.generate_command("specify", "Same desc", project_root)
+            generator.update_command("specify", "Same desc", project_root)
+            assert path.stat().st_mtime_ns == 1_000_000_000
+
+            generator.generate_command("specify", "Other desc", project_root)
+            assert path.stat().st_mtime_ns != 1_000_000_000
+            assert "description: Other desc" in path.read_text(encoding="utf-8")
+            assert not list(path.parent.glob("*.tmp"))
+
+    def test_update_command_status_reports_writes(self) -> None:
+        generator = ClaudeCommandGenerator()
+        with tempfile.TemporaryDirectory() as tmpdir:
+            project_root = Path(tmpdir)
+
+            path, written = generator.update_command_status("plan", "Desc", project_root)
+            assert path is not None and written is True
+
+            # 内容未变：返回路径但不写入
+            assert generator.update_command_status("plan", "Desc", project_root) == (
+                path,
+                False,
+            )
+            assert generator.update_command_status("plan", "New desc", project_root) == (
+                path,
+                False,
+            )
+
+            path.write_text(
+                path.read_text(encoding="utf-8").replace("## Outline", "## Old", 1),
+                encoding="utf-8",
+            )
+            assert generator.update_command_status("plan", "Desc", project_root) == (
+                path,
+                True,
+            )
+
+            path.write_text("user file without markers", encoding="utf-8")
+            assert generator.update_command_status("plan", "Desc", project_root) == (
+                None,
+                False,
+            )
+
     def test_update_command_preserves_user_content(self) -> None:
         generator = ClaudeCommandGenerator()
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -112,3 +237,31 @@ class TestClaudeCommandGenerator:
             updated = path.read_text(encoding="utf-8")
             assert "## User Custom Section" in updated
             assert "My custom content" in updated
+
+    def test_update_managed_block_keeps_backslashes_literal(self) -> None:
+        generator = ClaudeCommandGenerator()
+        existing = f"head\n{MANAGED_START}\nold\n{MANAGED_END}\ntail\n"
+        new_content = f"{MANAGED_START}\nregex: \\d+ \\1\n{MANAGED_END}\n"
+
+        updated = generator._update_managed_block(existing, new_content)
+
+        assert updated == f"head\n{MANAGED_START}\nregex: \\d+ \\1\n{MANAGED_END}\ntail\n"
+
+    def test_update_managed_block_replaces_only_first_block(self) -> None:
+        generator = ClaudeCommandGenerator()
+        existing = (
+            f"head\n{MANAGED_START}\nold\n{MANAGED_END}\nmid\n"
+            f"{MANAGED_START}\nsecond\n{MANAGED_END}\n"
+        )
+        new_content = f"x\n{MANAGED_START}\nnew\n{MANAGED_END}\ny\n"
+
+        updated = generator._update_managed_block(existing, new_content)
+
+        assert updated == (
+            f"head\n{MANAGED_START}\nnew\n{MANAGED_END}\nmid\n"
+            f"{MANAGED_START}\nsecond\n{MANAGED_END}\n"
+        )
+        # 任一方缺少完整区块时保持原样
+        assert generator._update_managed_block(existing, "no markers") == existing
+        unterminated = f"head\n{MANAGED_START}\nold\n"
+        assert generator._update_managed_block(unterminated, new_content) == unterminated
@@ -1,5 +1,6 @@
 """Tests for command_templates module."""
 
+import tomllib
 from pathlib import Path
 
 import pytest
@@ -66,6 +67,13 @@ class TestCommandTemplateContext:
         )
         assert ctx.extra["custom_key"] == "custom_value"
 
+    def test_uses_slots(self) -> None:
+        """Test context instances use __slots__ instead of a per-instance dict."""
+        ctx = CommandTemplateContext(command_name="specify")
+        assert not hasattr(ctx, "__dict__")
+        with pytest.raises(AttributeError):
+            ctx.unknown = 1  # type: ignore[attr-defined]
+
 
 class ConcreteTemplate(CommandTemplate):
     """Concrete implementation for testing."""
@@ -188,25 +196,46 @@ class TestRenderToml:
 
         content = template.render(ctx, fmt=RenderFormat.TOML)
 
-        # Check TOML structure
+        # Check TOML structure (literal multi-line string, no escaping needed)
         assert "[prompt]" in content
-        assert 'content = """' in content
+        assert "content = '''" in content
 
         # Check markdown content is embedded
         assert "## User Input" in content
         assert "cc-spec.specify" in content
 
-    def test_render_toml_escapes_triple_quotes(self) -> None:
-        """Test that triple quotes are escaped in TOML output."""
-        template = ConcreteTemplate()
+    def test_render_toml_is_valid_and_lossless(self) -> None:
+        """Test TOML output parses back to the exact markdown content."""
+        template = ConcreteTemplateWithGuidelines()
+        ctx = CommandTemplateContext(command_name="specify")
+        markdown = template.render(ctx)
+
+        content = template.render(ctx, fmt=RenderFormat.TOML)
+
+        assert tomllib.loads(content)["prompt"]["content"] == markdown + "\n"
+
+    @pytest.mark.parametrize(
+        "guidelines",
+        [
+            'Quote with """ and a path C:\\tmp\\new',
+            "Mixed ''' and \"\"\" with a trailing backslash \\",
+        ],
+    )
+    def test_render_toml_escapes_special_content(self, guidelines: str) -> None:
+        """Test quotes and backslashes survive a TOML round trip."""
+
+        class SpecialTemplate(ConcreteTemplate):
+            def get_guidelines(self, ctx: CommandTemplateContext) -> str:
+                return guidelines
+
+        template = SpecialTemplate()
         ctx = CommandTemplateContext(command_name="specify")
 
         content = template.render(ctx, fmt=RenderFormat.TOML)
 
-        # The content should be valid TOML with proper escaping
-        # Count opening and closing triple quotes
-        opening_quotes = content.count('content = """')
-        assert opening_quotes == 1
+        parsed = tomllib.loads(content)["prompt"]["content"]
+        assert parsed == template.render(ctx) + "\n"
+        assert guidelines in parsed
 
 
 class TestRenderFormat:
@@ -219,3 +248,22 @@ class TestRenderFormat:
     def test_toml_value(self) -> None:
         """Test TOML format value."""
         assert RenderFormat.TOML.value == "toml"
+
+
+class TestTemplateModules:
+    """Tests for the command template modules themselves."""
+
+    def test_no_duplicate_top_level_classes(self) -> None:
+        """Test no template module defines the same top-level class twice."""
+        import ast
+        from collections import Counter
+
+        import cc_spec.core.command_templates as package
+
+        for path in Path(package.__file__).parent.glob("*.py"):
+            tree = ast.parse(path.read_text(encoding="utf-8"))
+            counts = Counter(
+                node.name for node in tree.body if isinstance(node, ast.ClassDef)
+            )
+            duplicates = [name for name, count in counts.items() if count > 1]
+            assert not duplicates, f"{path.name} redefines {duplicates}"
@@ -360,6 +360,18 @@ class TestLoadConfig:
             assert config.agent == "claude"
             assert config.project_name == "my-project"
 
+    def test_load_config_keeps_raw_data(self) -> None:
+        """Test load_config exposes the parsed YAML dict, including unknown keys."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config_path = Path(tmpdir) / "config.yaml"
+            write_yaml(config_path, {"version": "1.0", "custom": {"keep": True}})
+
+            config = load_config(config_path)
+
+            assert config.raw_data == {"version": "1.0", "custom": {"keep": True}}
+            assert Config().raw_data is None
+            assert config == Config.from_dict({"version": "1.0"})
+
     def test_load_config_file_not_found(self) -> None:
         """Test loading config from non-existent file."""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -0,0 +1,86 @@
+"""Tests for utils.files helpers."""
+
+import os
+import stat
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from cc_spec.utils.files import atomic_write_bytes, write_text_if_changed
+
+
+class TestAtomicWriteBytes:
+    """Tests for atomic_write_bytes."""
+
+    def test_writes_bytes_verbatim(self, tmp_path: Path) -> None:
+        """Test content is written byte-for-byte (no newline translation)."""
+        path = tmp_path / "sub" / "file.md"
+        atomic_write_bytes(path, b"a\nb\r\nc")
+
+        assert path.read_bytes() == b"a\nb\r\nc"
+        assert not list(path.parent.glob("*.tmp"))
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="POSIX permission bits")
+    def test_preserves_existing_mode(self, tmp_path: Path) -> None:
+        """Test an existing file keeps its permission bits when rewritten."""
+        path = tmp_path / "hook.sh"
+        path.write_bytes(b"old")
+        path.chmod(0o755)
+
+        atomic_write_bytes(path, b"new")
+
+        assert path.read_bytes() == b"new"
+        assert stat.S_IMODE(path.stat().st_mode) == 0o755
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="POSIX permission bits")
+    def test_new_file_uses_umask_default_mode(self, tmp_path: Path) -> None:
+        """Test a new file gets the usual 0o666 & ~umask mode, not mkstemp's 0o600."""
+        path = tmp_path / "new.md"
+        atomic_write_bytes(path, b"data")
+
+        umask = os.umask(0)
+        os.umask(umask)
+        assert stat.S_IMODE(path.stat().st_mode) == 0o666 & ~umask
+
+    def test_concurrent_writers_to_same_path(self, tmp_path: Path) -> None:
+        """Test concurrent writers each use their own temp file and never clash."""
+        path = tmp_path / "shared.md"
+        payloads = [f"writer {i}\n".encode() * 100 for i in range(16)]
+
+        for _ in range(20):
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                list(executor.map(lambda data: atomic_write_bytes(path, data), payloads))
+
+            assert path.read_bytes() in payloads
+            assert not list(tmp_path.glob("*.tmp"))
+
+    def test_failed_replace_removes_temp_file(self, tmp_path: Path) -> None:
+        """Test the temp file is cleaned up when the final replace fails."""
+        path = tmp_path / "file.md"
+        path.write_bytes(b"old")
+
+        with patch("cc_spec.utils.files.os.replace", side_effect=OSError("boom")):
+            with pytest.raises(OSError):
+                atomic_write_bytes(path, b"new")
+
+        assert path.read_bytes() == b"old"
+        assert not list(path.parent.glob("*.tmp"))
+
+
+class TestWriteTextIfChanged:
+    """Tests for write_text_if_changed."""
+
+    def test_skips_identical_content(self, tmp_path: Path) -> None:
+        """Test identical content is not rewritten and keeps its mtime."""
+        path = tmp_path / "file.md"
+        assert write_text_if_changed(path, "line\n") is True
+        os.utime(path, ns=(1_000_000_000, 1_000_000_000))
+
+        assert write_text_if_changed(path, "line\n") is False
+        assert path.stat().st_mtime_ns == 1_000_000_000
+
+        assert write_text_if_changed(path, "other\n") is True
+        assert path.read_text(encoding="utf-8") == "other\n"
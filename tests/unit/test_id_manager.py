@@ -275,6 +275,18 @@ class TestIDManager:
         assert change_id == "C-001"
         assert entry.name == "test-change"
 
+    def test_get_change_by_name_tracks_registry_updates(self, temp_cc_spec: Path) -> None:
+        manager = IDManager(temp_cc_spec)
+        assert manager.get_change_by_name("late-change") is None
+
+        first_id = manager.register_change("late-change", Path("changes/late-change"))
+        result = manager.get_change_by_name("late-change")
+        assert result is not None
+        assert result[0] == first_id
+
+        manager.unregister_change(first_id)
+        assert manager.get_change_by_name("late-change") is None
+
     def test_list_changes(self, temp_cc_spec: Path) -> None:
         manager = IDManager(temp_cc_spec)
 
@@ -179,9 +179,9 @@ class TestPlanTemplate:
         """Test that rendered TOML has correct structure."""
         content = template.render(ctx, fmt=RenderFormat.TOML)
 
-        # 检查 TOML 结构
+        # 检查 TOML 结构（多行字面量字符串）
         assert "[prompt]" in content
-        assert 'content = """' in content
+        assert "content = '''" in content
 
         # 检查内嵌的 markdown 内容
         assert "## Outline" in content
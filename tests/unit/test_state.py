@@ -271,6 +271,21 @@ class TestUpdateState:
         update_state(state_file, state)
         assert state_file.exists()
 
+    def test_update_state_replaces_atomically(self, tmp_path: Path) -> None:
+        """Test that update_state overwrites via a temp file and leaves none behind."""
+        state_file = tmp_path / "status.yaml"
+        state_file.write_text("stale: true\n", encoding="utf-8")
+        state = ChangeState(
+            change_name="test",
+            created_at="2024-01-15T10:00:00Z",
+            current_stage=Stage.PLAN,
+        )
+
+        update_state(state_file, state)
+
+        assert load_state(state_file).current_stage == Stage.PLAN
+        assert list(tmp_path.iterdir()) == [state_file]
+
 
 class TestGetCurrentChange:
     """Tests for get_current_change function."""
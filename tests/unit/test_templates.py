@@ -134,6 +134,28 @@ class TestCopyTemplate:
         assert dest_path.exists()
         assert dest_path.read_text() == "Content"
 
+    def test_copy_template_reuses_cached_source(self, tmp_path):
+        """Test template source is cached and refreshed when the file changes."""
+        from cc_spec.core.templates import _load_template_source
+
+        source_dir = tmp_path / "source"
+        source_dir.mkdir()
+        template_path = source_dir / "template.md"
+        template_path.write_text("v1 {name}")
+
+        copy_template("template.md", tmp_path / "a.md", {"name": "x"}, source_dir)
+        hits = _load_template_source.cache_info().hits
+        copy_template("template.md", tmp_path / "b.md", {"name": "y"}, source_dir)
+
+        assert _load_template_source.cache_info().hits == hits + 1
+        assert (tmp_path / "b.md").read_text() == "v1 y"
+
+        # 模板内容变化后应重新读取
+        template_path.write_text("version 2 {name}")
+        copy_template("template.md", tmp_path / "c.md", {"name": "z"}, source_dir)
+
+        assert (tmp_path / "c.md").read_text() == "version 2 z"
+
 
 class TestListTemplates:
     """Tests for listing templates."""